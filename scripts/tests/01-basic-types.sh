@@ -134,6 +134,45 @@ val=$($VALKEY_CLI -h "$HOST" am.getint doc nonexistent)
 assert_equals "$val" ""
 echo "   ✓ Non-existent fields return null"
 
+# Test multi-put in a single change
+echo "Test 9: Multi-put (AM.MPUT)..."
+$VALKEY_CLI -h "$HOST" del mputdoc > /dev/null
+$VALKEY_CLI -h "$HOST" am.new mputdoc > /dev/null
+$VALKEY_CLI -h "$HOST" am.mput mputdoc user.name text "Alice" user.age int 30 user.score double 95.5 user.active bool true stats.views counter 7 > /dev/null
+
+name=$($VALKEY_CLI -h "$HOST" --raw am.gettext mputdoc user.name)
+age=$($VALKEY_CLI -h "$HOST" am.getint mputdoc user.age)
+score=$($VALKEY_CLI -h "$HOST" am.getdouble mputdoc user.score)
+active=$($VALKEY_CLI -h "$HOST" am.getbool mputdoc user.active)
+views=$($VALKEY_CLI -h "$HOST" am.getcounter mputdoc stats.views)
+assert_equals "$name" "Alice"
+assert_equals "$age" "30"
+assert_equals "$score" "95.5"
+assert_equals "$active" "1"
+assert_equals "$views" "7"
+
+changes=$($VALKEY_CLI -h "$HOST" am.numchanges mputdoc)
+assert_equals "$changes" "1" "AM.MPUT should produce a single change"
+echo "   ✓ Multi-put writes all values in one change"
+
+# An invalid value rejects the whole batch
+$VALKEY_CLI -h "$HOST" am.mput mputdoc user.city text "Paris" user.age int notanumber > /dev/null 2>&1 || true
+city=$($VALKEY_CLI -h "$HOST" am.gettext mputdoc user.city)
+assert_equals "$city" ""
+changes=$($VALKEY_CLI -h "$HOST" am.numchanges mputdoc)
+assert_equals "$changes" "1"
+echo "   ✓ Multi-put with an invalid value changes nothing"
+
+# Test multi-get in a single call
+echo "Test 10: Multi-get (AM.MGET)..."
+vals=$($VALKEY_CLI -h "$HOST" --raw am.mget mputdoc user.name user.age user.active stats.views nonexistent)
+assert_equals "$(echo "$vals" | sed -n 1p)" "Alice"
+assert_equals "$(echo "$vals" | sed -n 2p)" "30"
+assert_equals "$(echo "$vals" | sed -n 3p)" "1"
+assert_equals "$(echo "$vals" | sed -n 4p)" "7"
+assert_equals "$(echo "$vals" | sed -n 5p)" ""
+echo "   ✓ Multi-get returns every value in path order"
+
 rm -f /tmp/saved.bin
 
 echo ""
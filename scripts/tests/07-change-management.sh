@@ -92,5 +92,61 @@ num_changes=$($VALKEY_CLI -h "$HOST" am.numchanges changes_test7)
 assert_equals "$num_changes" "3"
 echo "   ✓ AM.NUMCHANGES tracks nested path operations correctly"
 
+echo "Test 8: AM.FORK copies a document..."
+$VALKEY_CLI -h "$HOST" del changes_test8 changes_test8_fork > /dev/null
+$VALKEY_CLI -h "$HOST" am.new changes_test8 > /dev/null
+$VALKEY_CLI -h "$HOST" am.puttext changes_test8 name "Dave" > /dev/null
+$VALKEY_CLI -h "$HOST" am.putint changes_test8 age 40 > /dev/null
+$VALKEY_CLI -h "$HOST" am.fork changes_test8 changes_test8_fork > /dev/null
+name=$($VALKEY_CLI -h "$HOST" --raw am.gettext changes_test8_fork name)
+assert_equals "$name" "Dave"
+num_changes=$($VALKEY_CLI -h "$HOST" am.numchanges changes_test8_fork)
+assert_equals "$num_changes" "2"
+echo "   ✓ AM.FORK copies content and history"
+
+echo "Test 9: AM.COPYCHANGES syncs documents server-side..."
+$VALKEY_CLI -h "$HOST" am.puttext changes_test8 city "Oslo" > /dev/null
+$VALKEY_CLI -h "$HOST" am.puttext changes_test8_fork country "Norway" > /dev/null
+copied=$($VALKEY_CLI -h "$HOST" am.copychanges changes_test8 changes_test8_fork)
+assert_equals "$copied" "1" "only the new city change should be copied"
+copied=$($VALKEY_CLI -h "$HOST" am.copychanges changes_test8_fork changes_test8)
+assert_equals "$copied" "1" "only the new country change should be copied"
+city=$($VALKEY_CLI -h "$HOST" --raw am.gettext changes_test8_fork city)
+country=$($VALKEY_CLI -h "$HOST" --raw am.gettext changes_test8 country)
+assert_equals "$city" "Oslo"
+assert_equals "$country" "Norway"
+num_a=$($VALKEY_CLI -h "$HOST" am.numchanges changes_test8)
+num_b=$($VALKEY_CLI -h "$HOST" am.numchanges changes_test8_fork)
+assert_equals "$num_a" "4"
+assert_equals "$num_b" "4"
+echo "   ✓ AM.COPYCHANGES merges documents in both directions"
+
+echo "Test 10: AM.HEADHASH detects convergence..."
+hash_a=$($VALKEY_CLI -h "$HOST" am.headhash changes_test8 | od -An -tx1 | tr -d ' \n')
+hash_b=$($VALKEY_CLI -h "$HOST" am.headhash changes_test8_fork | od -An -tx1 | tr -d ' \n')
+assert_equals "$hash_a" "$hash_b" "synced documents should have the same head hash"
+$VALKEY_CLI -h "$HOST" am.puttext changes_test8 extra "value" > /dev/null
+hash_a=$($VALKEY_CLI -h "$HOST" am.headhash changes_test8 | od -An -tx1 | tr -d ' \n')
+if [ "$hash_a" = "$hash_b" ]; then
+    echo "   ✗ Head hash did not change after a new edit"
+    exit 1
+fi
+echo "   ✓ AM.HEADHASH matches for converged documents only"
+
+echo "Test 11: AM.SAVESINCE and AM.LOADINCREMENTAL..."
+$VALKEY_CLI -h "$HOST" del changes_test11 > /dev/null
+$VALKEY_CLI -h "$HOST" am.new changes_test11 > /dev/null
+$VALKEY_CLI -h "$HOST" --raw am.savesince changes_test8 > /tmp/changes_test11.bin
+truncate -s -1 /tmp/changes_test11.bin
+added=$($VALKEY_CLI -h "$HOST" -x am.loadincremental changes_test11 < /tmp/changes_test11.bin)
+num_a=$($VALKEY_CLI -h "$HOST" am.numchanges changes_test8)
+assert_equals "$added" "$num_a"
+city=$($VALKEY_CLI -h "$HOST" --raw am.gettext changes_test11 city)
+assert_equals "$city" "Oslo"
+added=$($VALKEY_CLI -h "$HOST" -x am.loadincremental changes_test11 < /tmp/changes_test11.bin)
+assert_equals "$added" "0" "reloading the same blob should add nothing"
+echo "   ✓ AM.SAVESINCE blob loads into another document once"
+rm -f /tmp/changes_test11.bin
+
 echo ""
 echo "✅ All change management tests passed!"
@@ -1,56 +1,266 @@
 """
 pytest configuration and fixtures for valkey-automerge tests.
 """
+import asyncio
+import contextlib
 import os
+import sys
 
 import pytest
-import pytest_asyncio
-from redis.asyncio import Redis
+from pytest_asyncio import is_async_test
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.utils import HIREDIS_AVAILABLE
 
 
-@pytest_asyncio.fixture
-async def redis_client():
+class AutoPipelineClient:
     """
-    Async Valkey client fixture with binary data handling.
+    Redis client wrapper that coalesces execute_command calls into pipelines.
+
+    Commands issued in the same event-loop tick (e.g. the awaitables of one
+    asyncio.gather) are queued and flushed as a single non-transactional
+    pipeline on the next tick, so they reach the server in one write instead
+    of one round-trip each. Non-transactional pipelines are recycled rather
+    than allocated per use. Every other attribute is delegated to the
+    wrapped client.
+
+    Because a batch runs in order on one connection, gathered commands sent
+    through this wrapper never interleave on the server. Tests that exercise
+    concurrent access use the direct_client fixture instead.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._pending = []
+        self._flush_scheduled = False
+        self._idle_pipelines = []
+        # Strong references to in-flight flushes so they are not collected
+        self._flush_tasks = set()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        """
+        Return a pipeline for use with async with.
+
+        transaction=False pipelines come from a free list and are reset and
+        returned to it on exit, so the tests' many small pipelines reuse a
+        handful of Pipeline objects. Each concurrent user gets its own.
+        """
+        if transaction or shard_hint is not None:
+            return self._client.pipeline(transaction, shard_hint)
+        return self._reused_pipeline()
+
+    @contextlib.asynccontextmanager
+    async def _reused_pipeline(self):
+        if self._idle_pipelines:
+            pipe = self._idle_pipelines.pop()
+        else:
+            pipe = self._client.pipeline(transaction=False)
+        try:
+            yield pipe
+        finally:
+            await pipe.reset()
+            self._idle_pipelines.append(pipe)
+
+    def execute_command(self, *args, **options):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((args, options, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        self._flush_scheduled = False
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._execute(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _execute(self, batch):
+        try:
+            async with self.pipeline(transaction=False) as pipe:
+                for args, options, _ in batch:
+                    pipe.execute_command(*args, **options)
+                results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+async def reload(client, key, blob):
+    """
+    Replace the document at key with a previously saved blob.
+
+    AM.LOAD overwrites whatever is stored at the key (like RESTORE ... REPLACE),
+    so the DELETE that used to precede it is not needed.
+    """
+    await client.execute_command('AM.LOAD', key, blob)
+
+
+async def run_commands(client, commands, chunk=500):
+    """
+    Run a list of command tuples through pipelines of at most chunk commands.
+
+    Bounding the pipeline depth keeps most of the throughput win without the
+    reply-buffer stalls and latency spikes of one huge pipeline. Commands run
+    in order on one connection; results are returned in the same order.
+    """
+    results = []
+    for i in range(0, len(commands), chunk):
+        async with client.pipeline(transaction=False) as pipe:
+            for command in commands[i:i + chunk]:
+                pipe.execute_command(*command)
+            results.extend(await pipe.execute())
+    return results
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """
+    Run the session event loop on uvloop where it is available.
+
+    uvloop has cheaper epoll dispatch and future resolution than the default
+    selector loop, which matters when each test issues many tiny commands.
+    """
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+    import uvloop
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def hiredis_parser():
+    """
+    Fail loudly if the hiredis C parser is missing.
+
+    redis-py picks hiredis automatically when it is importable; without it
+    large AM.CHANGES replies are parsed in pure Python.
+    """
+    assert HIREDIS_AVAILABLE, "hiredis is required: pip install -r requirements.txt"
+
+
+@pytest.fixture(scope="session")
+async def redis_pool(worker_id):
+    """
+    Connection pool shared by every client in the session.
 
-    Yields a Redis client connected to the test instance.
-    Automatically closes connection after test completion.
+    Reusing pooled sockets avoids a fresh TCP connect for each client. The
+    pool blocks (up to 5 s) when all connections are checked out, so bursts
+    of concurrent pipelines wait for a socket instead of failing. Under
+    pytest-xdist each worker (gw0, gw1, ...) selects its own database so
+    FLUSHDB in one worker never clobbers another worker's keys. All pooled
+    connections are disconnected after the last test completes.
     """
     host = os.getenv('VALKEY_HOST', 'localhost')
     port = int(os.getenv('VALKEY_PORT', 6379))
+    db = int(worker_id[2:]) if worker_id.startswith('gw') else 0
+    if db >= 16:
+        pytest.fail(
+            f"worker {worker_id} needs database {db}, but Valkey has 16 "
+            "databases by default: run with --maxprocesses=16"
+        )
 
-    # Create client with decode_responses=False for binary data
-    client = Redis(
+    # Create pool with decode_responses=False for binary data
+    pool = BlockingConnectionPool(
         host=host,
         port=port,
+        db=db,
+        max_connections=32,
+        timeout=5,
         decode_responses=False,  # Return bytes, not strings
         socket_timeout=5.0,
-        socket_connect_timeout=5.0
+        socket_connect_timeout=5.0,
+        # Keep idle pooled sockets alive between tests
+        socket_keepalive=True
     )
 
+    yield pool
+
+    # Cleanup
+    await pool.disconnect()
+
+
+@pytest.fixture(scope="session")
+async def redis_client(redis_pool):
+    """
+    Async Valkey client fixture with binary data handling.
+
+    Yields a Redis client backed by the shared connection pool, wrapped so
+    that commands issued in the same event-loop tick are auto-pipelined.
+    The client is shared by the whole session so the connect/ping cost is
+    paid once; it is closed after the last test completes.
+    """
+    client = Redis(connection_pool=redis_pool)
+
     # Verify connection
     await client.ping()
 
+    yield AutoPipelineClient(client)
+
+    # Cleanup (the pool itself is disconnected by redis_pool)
+    await client.aclose()
+
+
+@pytest.fixture(scope="session")
+async def direct_client(redis_pool):
+    """
+    Plain async Valkey client on the shared pool, without auto-pipelining.
+
+    Each concurrent execute_command checks out its own pooled connection, so
+    commands gathered through this client really interleave on the server.
+    Concurrency tests send their gathered writes through it; setup and
+    verification can still go through redis_client.
+    """
+    client = Redis(connection_pool=redis_pool)
+
     yield client
 
-    # Cleanup
+    # Cleanup (the pool itself is disconnected by redis_pool)
     await client.aclose()
 
 
-@pytest_asyncio.fixture
-async def clean_redis(redis_client):
+@pytest.fixture
+async def clean_redis(request, redis_client):
     """
-    Flush the database before each test.
+    Clear state before tests marked with needs_flush.
 
-    Ensures tests start with a clean slate.
+    Every test creates its documents with AM.NEW, which replaces any value
+    left at the key by an earlier test, so most tests skip cleanup
+    entirely. Tests that rely on keys being absent opt in with
+    @pytest.mark.needs_flush('key1', 'key2'), which UNLINKs just those keys
+    in one pipeline and leaves every other test's keys alone. Arguments
+    containing '*' are SCAN MATCH patterns, so a test that prefixes its keys
+    can clear them all with @pytest.mark.needs_flush('mytest:*'). A bare
+    @pytest.mark.needs_flush falls back to FLUSHDB ASYNC, which frees memory
+    in a background thread.
     """
-    await redis_client.flushdb()
+    marker = request.node.get_closest_marker('needs_flush')
+    if marker is not None:
+        if marker.args:
+            keys = [key for key in marker.args if '*' not in key]
+            for pattern in marker.args:
+                if '*' in pattern:
+                    keys.extend([key async for key in redis_client.scan_iter(match=pattern, count=500)])
+            await run_commands(redis_client, [('UNLINK', key) for key in keys])
+        else:
+            await redis_client.flushdb(asynchronous=True)
     yield
-    # Optionally flush after test as well
-    await redis_client.flushdb()
 
 
-@pytest_asyncio.fixture
+@pytest.fixture
 async def sample_document(redis_client, clean_redis):
     """
     Create a sample document with various data types.
@@ -59,17 +269,78 @@ async def sample_document(redis_client, clean_redis):
     """
     key = 'sample_doc'
 
-    await redis_client.execute_command('AM.NEW', key)
-    await redis_client.execute_command('AM.PUTTEXT', key, 'name', 'Alice')
-    await redis_client.execute_command('AM.PUTINT', key, 'age', 30)
-    await redis_client.execute_command('AM.PUTDOUBLE', key, 'score', 95.5)
-    await redis_client.execute_command('AM.PUTBOOL', key, 'active', 1)
-    await redis_client.execute_command('AM.PUTCOUNTER', key, 'views', 0)
-    await redis_client.execute_command('AM.INCCOUNTER', key, 'views', 10)
+    # Queue the whole setup and send it in a single round-trip
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.NEW', key)
+        pipe.execute_command('AM.PUTTEXT', key, 'name', 'Alice')
+        pipe.execute_command('AM.PUTINT', key, 'age', 30)
+        pipe.execute_command('AM.PUTDOUBLE', key, 'score', 95.5)
+        pipe.execute_command('AM.PUTBOOL', key, 'active', 1)
+        pipe.execute_command('AM.PUTCOUNTER', key, 'views', 0)
+        pipe.execute_command('AM.INCCOUNTER', key, 'views', 10)
+        await pipe.execute()
 
     return key
 
 
+@pytest.fixture
+async def counter_doc(redis_client, baseline_dumps):
+    """
+    Document 'counter_doc' with a counter 'visits' initialized to 0.
+
+    Restored from the session's counter baseline in one command, so each
+    parametrized counter test starts from a fresh counter without replaying
+    AM.NEW and AM.PUTCOUNTER.
+    """
+    key = 'counter_doc'
+    await redis_client.execute_command('RESTORE', key, 0, baseline_dumps['counter'], 'REPLACE')
+    return key
+
+
+@pytest.fixture(scope="session")
+async def baseline_dumps(redis_client):
+    """
+    DUMP blobs of common document prefixes, built once per session.
+
+    Tests RESTORE a prefix into their own key with a single command instead
+    of replaying AM.NEW plus the setup writes:
+
+        await redis_client.execute_command('RESTORE', key, 0, baseline_dumps['list'], 'REPLACE')
+    """
+    prefixes = {
+        'text': [('AM.PUTTEXT', 'field1', 'value1')],
+        'list': [
+            ('AM.CREATELIST', 'items'),
+            ('AM.APPENDTEXT', 'items', 'item1'),
+            ('AM.APPENDTEXT', 'items', 'item2'),
+            ('AM.APPENDTEXT', 'items', 'item3'),
+        ],
+        'counter': [('AM.PUTCOUNTER', 'visits', 0)],
+    }
+    key = 'baseline_dump'
+
+    dumps = {}
+    for name, commands in prefixes.items():
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.execute_command('AM.NEW', key)
+            for command, *args in commands:
+                pipe.execute_command(command, key, *args)
+            pipe.execute_command('DUMP', key)
+            pipe.delete(key)
+            results = await pipe.execute()
+        dumps[name] = results[-2]
+
+    return dumps
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session event loop shared with redis_client."""
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line(
@@ -84,3 +355,6 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "persistence: marks tests that test save/load functionality"
     )
+    config.addinivalue_line(
+        "markers", "needs_flush(*keys): delete the given keys or key patterns (or flush the database) before the test runs"
+    )
@@ -5,128 +5,116 @@ Tests that changes are properly tracked and preserved through save/load cycles.
 """
 import pytest
 
+from conftest import reload, run_commands
+
+# Pre-encoded path arguments reused across tests
+USER_NAME = b'user.name'
+USER_AGE = b'user.age'
+USER_PROFILE_BIO = b'user.profile.bio'
+ITEMS = b'items'
+ITEMS_0 = b'items[0]'
+ITEMS_1 = b'items[1]'
+ITEMS_2 = b'items[2]'
+
 
 @pytest.mark.persistence
-async def test_single_change_preservation(redis_client, clean_redis):
+async def test_single_change_preservation(redis_client, clean_redis, baseline_dumps):
     """Test that a single change is preserved through save/load."""
-    # Create document with one change
-    await redis_client.execute_command('AM.NEW', 'test1')
-    await redis_client.execute_command('AM.PUTTEXT', 'test1', 'field1', 'value1')
+    # Restore a document with one change
+    await redis_client.execute_command('RESTORE', 'test1', 0, baseline_dumps['text'], 'REPLACE')
 
     # Get change count before save
     changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'test1')
 
     # Save and reload
     saved_data = await redis_client.execute_command('AM.SAVE', 'test1')
-    await redis_client.delete('test1')
-    await redis_client.execute_command('AM.LOAD', 'test1', saved_data)
+    await reload(redis_client, 'test1', saved_data)
 
-    # Verify change count preserved
-    changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'test1')
-    assert changes_before == changes_after == 1
+    # Verify change count and data preserved in one round-trip
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.NUMCHANGES', 'test1')
+        pipe.execute_command('AM.GETTEXT', 'test1', 'field1')
+        changes_after, value = await pipe.execute()
 
-    # Verify data preserved
-    value = await redis_client.execute_command('AM.GETTEXT', 'test1', 'field1')
+    assert changes_before == changes_after == 1
     assert value == b'value1'
 
 
 @pytest.mark.persistence
 async def test_multiple_changes_preservation(redis_client, clean_redis):
     """Test that multiple changes are preserved through save/load."""
-    await redis_client.execute_command('AM.NEW', 'test2')
-
-    # Make 5 different changes
-    await redis_client.execute_command('AM.PUTTEXT', 'test2', 'field1', 'value1')
-    await redis_client.execute_command('AM.PUTINT', 'test2', 'field2', 42)
-    await redis_client.execute_command('AM.PUTDOUBLE', 'test2', 'field3', 3.14)
-    await redis_client.execute_command('AM.PUTBOOL', 'test2', 'field4', 1)
-    await redis_client.execute_command('AM.PUTTEXT', 'test2', 'field5', 'value5')
-
-    changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'test2')
+    # Create the document and make 5 different changes in one round-trip
+    *_, changes_before = await run_commands(redis_client, [
+        ('AM.NEW', 'test2'),
+        ('AM.PUTTEXT', 'test2', 'field1', 'value1'),
+        ('AM.PUTINT', 'test2', 'field2', 42),
+        ('AM.PUTDOUBLE', 'test2', 'field3', 3.14),
+        ('AM.PUTBOOL', 'test2', 'field4', 1),
+        ('AM.PUTTEXT', 'test2', 'field5', 'value5'),
+        ('AM.NUMCHANGES', 'test2'),
+    ])
 
     # Save and reload
     saved_data = await redis_client.execute_command('AM.SAVE', 'test2')
-    await redis_client.delete('test2')
-    await redis_client.execute_command('AM.LOAD', 'test2', saved_data)
-
-    changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'test2')
-    assert changes_before == changes_after == 5
-
-    # Verify all values preserved
-    assert await redis_client.execute_command('AM.GETTEXT', 'test2', 'field1') == b'value1'
-    assert await redis_client.execute_command('AM.GETINT', 'test2', 'field2') == 42
-    assert await redis_client.execute_command('AM.GETDOUBLE', 'test2', 'field3') == b'3.14'
-    assert await redis_client.execute_command('AM.GETBOOL', 'test2', 'field4') == 1
-
-
-@pytest.mark.persistence
-@pytest.mark.slow
-async def test_large_change_history_50(redis_client, clean_redis):
-    """Test that a large change history (50 changes) is preserved."""
-    await redis_client.execute_command('AM.NEW', 'test3')
-
-    # Make 50 changes to the same field
-    for i in range(1, 51):
-        await redis_client.execute_command('AM.PUTINT', 'test3', 'counter', i)
-
-    changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'test3')
-    assert changes_before == 50
+    await reload(redis_client, 'test2', saved_data)
 
-    # Save and reload
-    saved_data = await redis_client.execute_command('AM.SAVE', 'test3')
-    await redis_client.delete('test3')
-    await redis_client.execute_command('AM.LOAD', 'test3', saved_data)
-
-    changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'test3')
-    assert changes_after == 50
+    # Verify change count and all values preserved in one round-trip
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.NUMCHANGES', 'test2')
+        pipe.execute_command('AM.GETTEXT', 'test2', 'field1')
+        pipe.execute_command('AM.GETINT', 'test2', 'field2')
+        pipe.execute_command('AM.GETDOUBLE', 'test2', 'field3')
+        pipe.execute_command('AM.GETBOOL', 'test2', 'field4')
+        results = await pipe.execute()
 
-    # Verify final value
-    final_value = await redis_client.execute_command('AM.GETINT', 'test3', 'counter')
-    assert final_value == 50
+    assert changes_before == 5
+    assert results == [5, b'value1', 42, b'3.14', 1]
 
 
 @pytest.mark.persistence
 @pytest.mark.slow
-async def test_very_large_change_history_200(redis_client, clean_redis):
-    """Test that a very large change history (200 changes) is preserved."""
-    await redis_client.execute_command('AM.NEW', 'test11')
-
-    # Make 200 changes
-    for i in range(1, 201):
-        await redis_client.execute_command('AM.PUTINT', 'test11', 'counter', i)
-
-    changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'test11')
-    assert changes_before == 200
+@pytest.mark.parametrize('key, n', [('test3', 50), ('test11', 200)])
+async def test_large_change_history(redis_client, clean_redis, key, n):
+    """Test that a large change history (50 and 200 changes) is preserved."""
+    # Create the document and make n changes to the same field through
+    # size-bounded pipelines. Constant arguments are pre-encoded so the
+    # encoder passes them through untouched.
+    cmd, key_bytes, field = b'AM.PUTINT', key.encode(), b'counter'
+    await run_commands(redis_client, [
+        (b'AM.NEW', key_bytes),
+        *[(cmd, key_bytes, field, i) for i in range(1, n + 1)],
+    ])
+
+    changes_before = await redis_client.execute_command('AM.NUMCHANGES', key)
+    assert changes_before == n
 
     # Save and reload
-    saved_data = await redis_client.execute_command('AM.SAVE', 'test11')
-    await redis_client.delete('test11')
-    await redis_client.execute_command('AM.LOAD', 'test11', saved_data)
-
-    changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'test11')
-    assert changes_after == 200
+    saved_data = await redis_client.execute_command('AM.SAVE', key)
+    await reload(redis_client, key, saved_data)
 
-    final_value = await redis_client.execute_command('AM.GETINT', 'test11', 'counter')
-    assert final_value == 200
+    # Verify change count and final value
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.NUMCHANGES', key)
+        pipe.execute_command('AM.GETINT', key, 'counter')
+        assert await pipe.execute() == [n, n]
 
 
 @pytest.mark.persistence
 async def test_changes_before_and_after_save_cycle(redis_client, clean_redis):
     """Test that changes made before and after save/load are both tracked."""
-    await redis_client.execute_command('AM.NEW', 'test4')
-
-    # Make 3 changes before save
-    await redis_client.execute_command('AM.PUTTEXT', 'test4', 'field1', 'before1')
-    await redis_client.execute_command('AM.PUTTEXT', 'test4', 'field2', 'before2')
-    await redis_client.execute_command('AM.PUTTEXT', 'test4', 'field3', 'before3')
-
-    changes_before_save = await redis_client.execute_command('AM.NUMCHANGES', 'test4')
+    # Create the document and make 3 changes before save
+    *_, changes_before_save = await run_commands(redis_client, [
+        ('AM.NEW', 'test4'),
+        ('AM.PUTTEXT', 'test4', 'field1', 'before1'),
+        ('AM.PUTTEXT', 'test4', 'field2', 'before2'),
+        ('AM.PUTTEXT', 'test4', 'field3', 'before3'),
+        ('AM.NUMCHANGES', 'test4'),
+    ])
     assert changes_before_save == 3
 
     # Save and reload
     saved_data = await redis_client.execute_command('AM.SAVE', 'test4')
-    await redis_client.delete('test4')
-    await redis_client.execute_command('AM.LOAD', 'test4', saved_data)
+    await reload(redis_client, 'test4', saved_data)
 
     changes_after_load = await redis_client.execute_command('AM.NUMCHANGES', 'test4')
     assert changes_after_load == 3
@@ -142,105 +130,107 @@ async def test_changes_before_and_after_save_cycle(redis_client, clean_redis):
 @pytest.mark.persistence
 async def test_nested_paths_preservation(redis_client, clean_redis):
     """Test that nested path operations are preserved through save/load."""
-    await redis_client.execute_command('AM.NEW', 'test5')
-
-    # Create nested structure
-    await redis_client.execute_command('AM.PUTTEXT', 'test5', 'user.name', 'Alice')
-    await redis_client.execute_command('AM.PUTINT', 'test5', 'user.age', 30)
-    await redis_client.execute_command('AM.PUTTEXT', 'test5', 'user.profile.bio', 'Hello World')
-
-    changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'test5')
+    # Create the document with a nested structure
+    *_, changes_before = await run_commands(redis_client, [
+        ('AM.NEW', 'test5'),
+        ('AM.PUTTEXT', 'test5', USER_NAME, 'Alice'),
+        ('AM.PUTINT', 'test5', USER_AGE, 30),
+        ('AM.PUTTEXT', 'test5', USER_PROFILE_BIO, 'Hello World'),
+        ('AM.NUMCHANGES', 'test5'),
+    ])
 
     # Save and reload
     saved_data = await redis_client.execute_command('AM.SAVE', 'test5')
-    await redis_client.delete('test5')
-    await redis_client.execute_command('AM.LOAD', 'test5', saved_data)
+    await reload(redis_client, 'test5', saved_data)
 
-    changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'test5')
-    assert changes_before == changes_after == 3
+    # Verify change count and nested data in one round-trip
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.NUMCHANGES', 'test5')
+        pipe.execute_command('AM.GETTEXT', 'test5', USER_NAME)
+        pipe.execute_command('AM.GETINT', 'test5', USER_AGE)
+        pipe.execute_command('AM.GETTEXT', 'test5', USER_PROFILE_BIO)
+        results = await pipe.execute()
 
-    # Verify nested data
-    assert await redis_client.execute_command('AM.GETTEXT', 'test5', 'user.name') == b'Alice'
-    assert await redis_client.execute_command('AM.GETINT', 'test5', 'user.age') == 30
-    assert await redis_client.execute_command('AM.GETTEXT', 'test5', 'user.profile.bio') == b'Hello World'
+    assert changes_before == 3
+    assert results == [3, b'Alice', 30, b'Hello World']
 
 
 @pytest.mark.persistence
-async def test_list_operations_preservation(redis_client, clean_redis):
+async def test_list_operations_preservation(redis_client, clean_redis, baseline_dumps):
     """Test that list operations are preserved through save/load."""
-    await redis_client.execute_command('AM.NEW', 'test6')
+    # Restore a document with a populated list (createlist + 3 appends)
+    await redis_client.execute_command('RESTORE', 'test6', 0, baseline_dumps['list'], 'REPLACE')
 
-    # Create and populate list
-    await redis_client.execute_command('AM.CREATELIST', 'test6', 'items')
-    await redis_client.execute_command('AM.APPENDTEXT', 'test6', 'items', 'item1')
-    await redis_client.execute_command('AM.APPENDTEXT', 'test6', 'items', 'item2')
-    await redis_client.execute_command('AM.APPENDTEXT', 'test6', 'items', 'item3')
-    await redis_client.execute_command('AM.PUTTEXT', 'test6', 'items[1]', 'modified')
+    await redis_client.execute_command('AM.PUTTEXT', 'test6', ITEMS_1, 'modified')
 
     changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'test6')
 
     # Save and reload
     saved_data = await redis_client.execute_command('AM.SAVE', 'test6')
-    await redis_client.delete('test6')
-    await redis_client.execute_command('AM.LOAD', 'test6', saved_data)
-
-    changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'test6')
-    assert changes_before == changes_after == 5
+    await reload(redis_client, 'test6', saved_data)
 
-    # Verify list data
-    length = await redis_client.execute_command('AM.LISTLEN', 'test6', 'items')
-    assert length == 3
+    # Verify change count and list data in one round-trip
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.NUMCHANGES', 'test6')
+        pipe.execute_command('AM.LISTLEN', 'test6', ITEMS)
+        pipe.execute_command('AM.GETTEXT', 'test6', ITEMS_0)
+        pipe.execute_command('AM.GETTEXT', 'test6', ITEMS_1)
+        pipe.execute_command('AM.GETTEXT', 'test6', ITEMS_2)
+        results = await pipe.execute()
 
-    assert await redis_client.execute_command('AM.GETTEXT', 'test6', 'items[0]') == b'item1'
-    assert await redis_client.execute_command('AM.GETTEXT', 'test6', 'items[1]') == b'modified'
-    assert await redis_client.execute_command('AM.GETTEXT', 'test6', 'items[2]') == b'item3'
+    assert changes_before == 5
+    assert results == [5, 3, b'item1', b'modified', b'item3']
 
 
 @pytest.mark.persistence
 async def test_text_splice_preservation(redis_client, clean_redis):
     """Test that text splice operations are preserved through save/load."""
-    await redis_client.execute_command('AM.NEW', 'test7')
-
-    # Create text and splice it
-    await redis_client.execute_command('AM.PUTTEXT', 'test7', 'content', 'Hello World')
-    await redis_client.execute_command('AM.SPLICETEXT', 'test7', 'content', 6, 5, 'Redis')
-
-    changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'test7')
+    # Create the document with text and splice it
+    *_, changes_before = await run_commands(redis_client, [
+        ('AM.NEW', 'test7'),
+        ('AM.PUTTEXT', 'test7', 'content', 'Hello World'),
+        ('AM.SPLICETEXT', 'test7', 'content', 6, 5, 'Redis'),
+        ('AM.NUMCHANGES', 'test7'),
+    ])
 
     # Save and reload
     saved_data = await redis_client.execute_command('AM.SAVE', 'test7')
-    await redis_client.delete('test7')
-    await redis_client.execute_command('AM.LOAD', 'test7', saved_data)
+    await reload(redis_client, 'test7', saved_data)
 
-    changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'test7')
-    assert changes_before == changes_after == 3  # puttext + 2 splices
+    # Verify change count and spliced content in one round-trip
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.NUMCHANGES', 'test7')
+        pipe.execute_command('AM.GETTEXT', 'test7', 'content')
+        changes_after, content = await pipe.execute()
 
-    # Verify spliced content
-    content = await redis_client.execute_command('AM.GETTEXT', 'test7', 'content')
+    assert changes_before == changes_after == 3  # puttext + 2 splices
     assert content == b'Hello Redis'
 
 
 @pytest.mark.persistence
-async def test_counter_operations_preservation(redis_client, clean_redis):
+async def test_counter_operations_preservation(redis_client, clean_redis, baseline_dumps):
     """Test that counter operations are preserved through save/load."""
-    await redis_client.execute_command('AM.NEW', 'test13')
+    # Restore a document with a zeroed counter
+    await redis_client.execute_command('RESTORE', 'test13', 0, baseline_dumps['counter'], 'REPLACE')
 
     # Counter operations
-    await redis_client.execute_command('AM.PUTCOUNTER', 'test13', 'visits', 0)
     await redis_client.execute_command('AM.INCCOUNTER', 'test13', 'visits', 1)
     await redis_client.execute_command('AM.INCCOUNTER', 'test13', 'visits', 5)
     await redis_client.execute_command('AM.INCCOUNTER', 'test13', 'visits', 3)
 
-    changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'test13')
-    value_before = await redis_client.execute_command('AM.GETCOUNTER', 'test13', 'visits')
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.NUMCHANGES', 'test13')
+        pipe.execute_command('AM.GETCOUNTER', 'test13', 'visits')
+        changes_before, value_before = await pipe.execute()
 
     # Save and reload
     saved_data = await redis_client.execute_command('AM.SAVE', 'test13')
-    await redis_client.delete('test13')
-    await redis_client.execute_command('AM.LOAD', 'test13', saved_data)
+    await reload(redis_client, 'test13', saved_data)
 
-    changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'test13')
-    value_after = await redis_client.execute_command('AM.GETCOUNTER', 'test13', 'visits')
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.NUMCHANGES', 'test13')
+        pipe.execute_command('AM.GETCOUNTER', 'test13', 'visits')
+        changes_after, value_after = await pipe.execute()
 
     assert changes_before == changes_after == 4
     assert value_before == value_after == 9
@@ -249,26 +239,26 @@ async def test_counter_operations_preservation(redis_client, clean_redis):
 @pytest.mark.persistence
 async def test_timestamp_operations_preservation(redis_client, clean_redis):
     """Test that timestamp operations are preserved through save/load."""
-    await redis_client.execute_command('AM.NEW', 'test14')
-
-    # Timestamp operations
-    await redis_client.execute_command('AM.PUTTIMESTAMP', 'test14', 'created', 1234567890000)
-    await redis_client.execute_command('AM.PUTTIMESTAMP', 'test14', 'updated', 9876543210000)
-
-    changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'test14')
+    # Create the document with timestamp operations
+    *_, changes_before = await run_commands(redis_client, [
+        ('AM.NEW', 'test14'),
+        ('AM.PUTTIMESTAMP', 'test14', 'created', 1234567890000),
+        ('AM.PUTTIMESTAMP', 'test14', 'updated', 9876543210000),
+        ('AM.NUMCHANGES', 'test14'),
+    ])
 
     # Save and reload
     saved_data = await redis_client.execute_command('AM.SAVE', 'test14')
-    await redis_client.delete('test14')
-    await redis_client.execute_command('AM.LOAD', 'test14', saved_data)
+    await reload(redis_client, 'test14', saved_data)
 
-    changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'test14')
-    assert changes_before == changes_after == 2
-
-    # Verify timestamps
-    created = await redis_client.execute_command('AM.GETTIMESTAMP', 'test14', 'created')
-    updated = await redis_client.execute_command('AM.GETTIMESTAMP', 'test14', 'updated')
+    # Verify change count and timestamps in one round-trip
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.NUMCHANGES', 'test14')
+        pipe.execute_command('AM.GETTIMESTAMP', 'test14', 'created')
+        pipe.execute_command('AM.GETTIMESTAMP', 'test14', 'updated')
+        changes_after, created, updated = await pipe.execute()
 
+    assert changes_before == changes_after == 2
     assert created == 1234567890000
     assert updated == 9876543210000
 
@@ -276,15 +266,15 @@ async def test_timestamp_operations_preservation(redis_client, clean_redis):
 @pytest.mark.persistence
 async def test_empty_document_preservation(redis_client, clean_redis):
     """Test that an empty document can be saved and loaded."""
-    await redis_client.execute_command('AM.NEW', 'test9')
-
-    changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'test9')
+    _, changes_before = await run_commands(redis_client, [
+        ('AM.NEW', 'test9'),
+        ('AM.NUMCHANGES', 'test9'),
+    ])
     assert changes_before == 0
 
     # Save and reload
     saved_data = await redis_client.execute_command('AM.SAVE', 'test9')
-    await redis_client.delete('test9')
-    await redis_client.execute_command('AM.LOAD', 'test9', saved_data)
+    await reload(redis_client, 'test9', saved_data)
 
     changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'test9')
     assert changes_after == 0
@@ -295,71 +285,77 @@ async def test_multiple_save_load_cycles(redis_client, clean_redis):
     """Test that multiple save/load cycles preserve change history."""
     await redis_client.execute_command('AM.NEW', 'test10')
 
-    # Cycle 1
-    await redis_client.execute_command('AM.PUTTEXT', 'test10', 'field', 'cycle1')
-    changes_1 = await redis_client.execute_command('AM.NUMCHANGES', 'test10')
-
-    saved_data = await redis_client.execute_command('AM.SAVE', 'test10')
-    await redis_client.delete('test10')
-    await redis_client.execute_command('AM.LOAD', 'test10', saved_data)
-
-    changes_2 = await redis_client.execute_command('AM.NUMCHANGES', 'test10')
-    assert changes_1 == changes_2 == 1
-
-    # Cycle 2
-    await redis_client.execute_command('AM.PUTTEXT', 'test10', 'field', 'cycle2')
-    changes_3 = await redis_client.execute_command('AM.NUMCHANGES', 'test10')
-
-    saved_data = await redis_client.execute_command('AM.SAVE', 'test10')
-    await redis_client.delete('test10')
-    await redis_client.execute_command('AM.LOAD', 'test10', saved_data)
-
-    changes_4 = await redis_client.execute_command('AM.NUMCHANGES', 'test10')
-    assert changes_3 == changes_4 == 2
+    for cycle in range(1, 4):
+        # Write and save in one round-trip; AM.LOAD needs the saved blob,
+        # so the reload goes out as a second pipeline
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.execute_command('AM.PUTTEXT', 'test10', 'field', f'cycle{cycle}')
+            pipe.execute_command('AM.NUMCHANGES', 'test10')
+            pipe.execute_command('AM.SAVE', 'test10')
+            _, changes_before, saved_data = await pipe.execute()
 
-    # Cycle 3
-    await redis_client.execute_command('AM.PUTTEXT', 'test10', 'field', 'cycle3')
-    changes_5 = await redis_client.execute_command('AM.NUMCHANGES', 'test10')
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.execute_command('AM.LOAD', 'test10', saved_data)
+            pipe.execute_command('AM.NUMCHANGES', 'test10')
+            _, changes_after = await pipe.execute()
 
-    saved_data = await redis_client.execute_command('AM.SAVE', 'test10')
-    await redis_client.delete('test10')
-    await redis_client.execute_command('AM.LOAD', 'test10', saved_data)
-
-    changes_6 = await redis_client.execute_command('AM.NUMCHANGES', 'test10')
-    assert changes_5 == changes_6 == 3
+        assert changes_before == changes_after == cycle
 
 
 @pytest.mark.persistence
 async def test_change_hash_consistency(redis_client, clean_redis):
     """Test that change hashes remain consistent through save/load."""
-    await redis_client.execute_command('AM.NEW', 'test15')
-
-    # Make some changes
-    await redis_client.execute_command('AM.PUTTEXT', 'test15', 'field1', 'value1')
-    await redis_client.execute_command('AM.PUTTEXT', 'test15', 'field2', 'value2')
-    await redis_client.execute_command('AM.PUTTEXT', 'test15', 'field3', 'value3')
-
-    # Get change hashes before save
-    changes_before = await redis_client.execute_command('AM.CHANGES', 'test15')
-    changes_count_before = await redis_client.execute_command('AM.NUMCHANGES', 'test15')
+    # Create the document, make some changes and get change hashes before save
+    *_, changes_before, changes_count_before = await run_commands(redis_client, [
+        ('AM.NEW', 'test15'),
+        ('AM.PUTTEXT', 'test15', 'field1', 'value1'),
+        ('AM.PUTTEXT', 'test15', 'field2', 'value2'),
+        ('AM.PUTTEXT', 'test15', 'field3', 'value3'),
+        ('AM.CHANGES', 'test15'),
+        ('AM.NUMCHANGES', 'test15'),
+    ])
 
     # Save and reload
     saved_data = await redis_client.execute_command('AM.SAVE', 'test15')
-    await redis_client.delete('test15')
-    await redis_client.execute_command('AM.LOAD', 'test15', saved_data)
+    await reload(redis_client, 'test15', saved_data)
 
     # Get change hashes after load
-    changes_after = await redis_client.execute_command('AM.CHANGES', 'test15')
-    changes_count_after = await redis_client.execute_command('AM.NUMCHANGES', 'test15')
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.CHANGES', 'test15')
+        pipe.execute_command('AM.NUMCHANGES', 'test15')
+        changes_after, changes_count_after = await pipe.execute()
 
     # Verify same number of changes
     assert changes_count_before == changes_count_after == 3
 
-    # Verify changes are a list of bytes
-    assert isinstance(changes_before, list)
-    assert isinstance(changes_after, list)
+    # Verify the very same change blobs come back (hash identity, not just count)
     assert len(changes_before) == len(changes_after) == 3
+    assert set(changes_before) == set(changes_after)
 
-    # All changes should be binary data
-    assert all(isinstance(c, bytes) for c in changes_before)
-    assert all(isinstance(c, bytes) for c in changes_after)
+
+@pytest.mark.persistence
+async def test_heads_incremental_changes(redis_client, clean_redis):
+    """Test that AM.CHANGES with remembered heads returns only newer changes."""
+    *_, heads = await run_commands(redis_client, [
+        ('AM.NEW', 'test16'),
+        ('AM.PUTTEXT', 'test16', 'field1', 'value1'),
+        ('AM.HEADS', 'test16'),
+    ])
+    assert len(heads) == 1
+
+    # Nothing is new relative to the current heads
+    changes = await redis_client.execute_command('AM.CHANGES', 'test16', *heads)
+    assert changes == []
+
+    await redis_client.execute_command('AM.PUTTEXT', 'test16', 'field2', 'value2')
+    await redis_client.execute_command('AM.PUTTEXT', 'test16', 'field3', 'value3')
+
+    # Only the two later changes are returned
+    changes = await redis_client.execute_command('AM.CHANGES', 'test16', *heads)
+    assert len(changes) == 2
+
+    # Heads survive save/load
+    heads = await redis_client.execute_command('AM.HEADS', 'test16')
+    saved_data = await redis_client.execute_command('AM.SAVE', 'test16')
+    await reload(redis_client, 'test16', saved_data)
+    assert await redis_client.execute_command('AM.HEADS', 'test16') == heads
@@ -6,68 +6,92 @@ Tests concurrent operations on the same document to verify CRDT behavior.
 import pytest
 import asyncio
 
+from conftest import run_commands
 
-@pytest.mark.concurrent
-async def test_concurrent_counter_increments(redis_client, clean_redis):
-    """Test that concurrent counter increments are properly accumulated."""
-    await redis_client.execute_command('AM.NEW', 'shared_counter')
-    await redis_client.execute_command('AM.PUTCOUNTER', 'shared_counter', 'views', 0)
 
-    # Run 5 concurrent increments
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.INCCOUNTER', 'shared_counter', 'views', 1)
-        for _ in range(5)
-    ])
+@pytest.mark.concurrent
+@pytest.mark.parametrize("increments, pipelined", [
+    pytest.param([1] * 5, False, id="concurrent"),
+    pytest.param([1] * 20, False, id="stress", marks=pytest.mark.slow),
+    pytest.param([5, -2] * 10, True, id="rapid_inc_dec"),
+])
+async def test_counter_increments(redis_client, direct_client, counter_doc, increments, pipelined):
+    """Test that counter increments are properly accumulated."""
+    # Build one pre-encoded argv tuple per distinct delta and reuse it across
+    # the batch, so redis-py packs it without re-encoding str arguments
+    prefix = (b'AM.INCCOUNTER', counter_doc.encode(), b'visits')
+    argv = {delta: (*prefix, str(delta).encode()) for delta in set(increments)}
+
+    if pipelined:
+        # Rapid back-to-back increments go out as one ordered pipeline
+        await run_commands(redis_client, [argv[delta] for delta in increments])
+    else:
+        # Each increment checks out its own connection, so they interleave
+        await asyncio.gather(*[
+            direct_client.execute_command(*argv[delta])
+            for delta in increments
+        ])
+
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.execute_command('AM.GETCOUNTER', counter_doc, 'visits')
+        pipe.execute_command('AM.NUMCHANGES', counter_doc)
+        value, changes = await pipe.execute()
 
     # Counter should show sum of all increments
-    value = await redis_client.execute_command('AM.GETCOUNTER', 'shared_counter', 'views')
-    assert value == 5
+    assert value == sum(increments)
 
-    # Should have 6 changes total (1 putcounter + 5 increments)
-    changes = await redis_client.execute_command('AM.NUMCHANGES', 'shared_counter')
-    assert changes == 6
+    # One change for the putcounter plus one per increment
+    assert changes == 1 + len(increments)
 
 
 @pytest.mark.concurrent
-async def test_concurrent_list_appends(redis_client, clean_redis):
+async def test_concurrent_list_appends(redis_client, direct_client, clean_redis):
     """Test that concurrent list appends all succeed."""
-    await redis_client.execute_command('AM.NEW', 'shared_list')
-    await redis_client.execute_command('AM.CREATELIST', 'shared_list', 'items')
+    # Create the document and its list in one round-trip
+    await run_commands(redis_client, [
+        ('AM.NEW', 'shared_list'),
+        ('AM.CREATELIST', 'shared_list', 'items'),
+    ])
 
     # Append 3 items concurrently
     items = ['item_1', 'item_2', 'item_3']
     await asyncio.gather(*[
-        redis_client.execute_command('AM.APPENDTEXT', 'shared_list', 'items', item)
+        direct_client.execute_command('AM.APPENDTEXT', 'shared_list', 'items', item)
         for item in items
     ])
 
+    length, changes = await run_commands(redis_client, [
+        ('AM.LISTLEN', 'shared_list', 'items'),
+        ('AM.NUMCHANGES', 'shared_list'),
+    ])
+
     # List should have all 3 items
-    length = await redis_client.execute_command('AM.LISTLEN', 'shared_list', 'items')
     assert length == 3
 
     # Should have 4 changes (createlist + 3 appends)
-    changes = await redis_client.execute_command('AM.NUMCHANGES', 'shared_list')
     assert changes == 4
 
 
 @pytest.mark.concurrent
-async def test_concurrent_nested_path_creation(redis_client, clean_redis):
+async def test_concurrent_nested_path_creation(redis_client, direct_client, clean_redis):
     """Test that concurrent nested path operations all succeed."""
     await redis_client.execute_command('AM.NEW', 'shared_nested')
 
     # Create different nested paths concurrently
     await asyncio.gather(
-        redis_client.execute_command('AM.PUTTEXT', 'shared_nested', 'user.profile.name', 'Alice'),
-        redis_client.execute_command('AM.PUTINT', 'shared_nested', 'user.profile.age', 30),
-        redis_client.execute_command('AM.PUTTEXT', 'shared_nested', 'user.settings.theme', 'dark'),
-        redis_client.execute_command('AM.PUTBOOL', 'shared_nested', 'user.settings.notifications', 1)
+        direct_client.execute_command('AM.PUTTEXT', 'shared_nested', 'user.profile.name', 'Alice'),
+        direct_client.execute_command('AM.PUTINT', 'shared_nested', 'user.profile.age', 30),
+        direct_client.execute_command('AM.PUTTEXT', 'shared_nested', 'user.settings.theme', 'dark'),
+        direct_client.execute_command('AM.PUTBOOL', 'shared_nested', 'user.settings.notifications', 1)
     )
 
     # All fields should be accessible
-    name = await redis_client.execute_command('AM.GETTEXT', 'shared_nested', 'user.profile.name')
-    age = await redis_client.execute_command('AM.GETINT', 'shared_nested', 'user.profile.age')
-    theme = await redis_client.execute_command('AM.GETTEXT', 'shared_nested', 'user.settings.theme')
-    notif = await redis_client.execute_command('AM.GETBOOL', 'shared_nested', 'user.settings.notifications')
+    name, age, theme, notif = await run_commands(redis_client, [
+        ('AM.GETTEXT', 'shared_nested', 'user.profile.name'),
+        ('AM.GETINT', 'shared_nested', 'user.profile.age'),
+        ('AM.GETTEXT', 'shared_nested', 'user.settings.theme'),
+        ('AM.GETBOOL', 'shared_nested', 'user.settings.notifications'),
+    ])
 
     assert name == b'Alice'
     assert age == 30
@@ -75,56 +99,83 @@ async def test_concurrent_nested_path_creation(redis_client, clean_redis):
     assert notif == 1
 
 
+async def test_mput_nested_path_creation(redis_client, clean_redis):
+    """Test that one AM.MPUT creates several nested paths in a single change."""
+    # Create the document and different nested paths in a single change
+    *_, name, age, theme, notif, changes = await run_commands(redis_client, [
+        ('AM.NEW', 'mput_nested'),
+        (
+            'AM.MPUT', 'mput_nested',
+            'user.profile.name', 'text', 'Alice',
+            'user.profile.age', 'int', 30,
+            'user.settings.theme', 'text', 'dark',
+            'user.settings.notifications', 'bool', 1,
+        ),
+        ('AM.GETTEXT', 'mput_nested', 'user.profile.name'),
+        ('AM.GETINT', 'mput_nested', 'user.profile.age'),
+        ('AM.GETTEXT', 'mput_nested', 'user.settings.theme'),
+        ('AM.GETBOOL', 'mput_nested', 'user.settings.notifications'),
+        ('AM.NUMCHANGES', 'mput_nested'),
+    ])
+
+    assert name == b'Alice'
+    assert age == 30
+    assert theme == b'dark'
+    assert notif == 1
+    assert changes == 1
+
+
 @pytest.mark.concurrent
-async def test_concurrent_edits_to_same_field(redis_client, clean_redis):
+async def test_concurrent_edits_to_same_field(redis_client, direct_client, clean_redis):
     """Test conflict resolution when multiple clients edit the same field."""
     await redis_client.execute_command('AM.NEW', 'shared_text')
 
     # Three concurrent edits to the same field (LWW - Last Write Wins)
     await asyncio.gather(
-        redis_client.execute_command('AM.PUTTEXT', 'shared_text', 'content', 'version_1'),
-        redis_client.execute_command('AM.PUTTEXT', 'shared_text', 'content', 'version_2'),
-        redis_client.execute_command('AM.PUTTEXT', 'shared_text', 'content', 'version_3')
+        direct_client.execute_command('AM.PUTTEXT', 'shared_text', 'content', 'version_1'),
+        direct_client.execute_command('AM.PUTTEXT', 'shared_text', 'content', 'version_2'),
+        direct_client.execute_command('AM.PUTTEXT', 'shared_text', 'content', 'version_3')
     )
 
     # One version will win (deterministic based on Automerge's algorithm)
-    content = await redis_client.execute_command('AM.GETTEXT', 'shared_text', 'content')
+    content, changes = await run_commands(redis_client, [
+        ('AM.GETTEXT', 'shared_text', 'content'),
+        ('AM.NUMCHANGES', 'shared_text'),
+    ])
 
     # Should be one of the versions
     assert content in [b'version_1', b'version_2', b'version_3']
 
     # Should have 3 changes recorded
-    changes = await redis_client.execute_command('AM.NUMCHANGES', 'shared_text')
     assert changes == 3
 
 
 @pytest.mark.concurrent
-async def test_concurrent_operations_then_persistence(redis_client, clean_redis):
+async def test_concurrent_operations_then_persistence(redis_client, direct_client, clean_redis):
     """Test that concurrent operations persist correctly through save/load."""
     await redis_client.execute_command('AM.NEW', 'concurrent_doc')
 
     # Multiple concurrent operations of different types
     await asyncio.gather(
-        redis_client.execute_command('AM.PUTTEXT', 'concurrent_doc', 'data.name', 'Test'),
-        redis_client.execute_command('AM.PUTINT', 'concurrent_doc', 'data.count', 42),
-        redis_client.execute_command('AM.PUTCOUNTER', 'concurrent_doc', 'data.views', 0)
+        direct_client.execute_command('AM.PUTTEXT', 'concurrent_doc', 'data.name', 'Test'),
+        direct_client.execute_command('AM.PUTINT', 'concurrent_doc', 'data.count', 42),
+        direct_client.execute_command('AM.PUTCOUNTER', 'concurrent_doc', 'data.views', 0)
     )
 
     await redis_client.execute_command('AM.INCCOUNTER', 'concurrent_doc', 'data.views', 10)
 
     changes_before = await redis_client.execute_command('AM.NUMCHANGES', 'concurrent_doc')
 
-    # Save and reload
-    saved_data = await redis_client.execute_command('AM.SAVE', 'concurrent_doc')
-    await redis_client.delete('concurrent_doc')
-    await redis_client.execute_command('AM.LOAD', 'concurrent_doc', saved_data)
-
-    changes_after = await redis_client.execute_command('AM.NUMCHANGES', 'concurrent_doc')
+    # Save and reload server-side
+    await redis_client.execute_command('AM.COMPACT', 'concurrent_doc')
 
     # Verify all data preserved
-    name = await redis_client.execute_command('AM.GETTEXT', 'concurrent_doc', 'data.name')
-    count = await redis_client.execute_command('AM.GETINT', 'concurrent_doc', 'data.count')
-    views = await redis_client.execute_command('AM.GETCOUNTER', 'concurrent_doc', 'data.views')
+    changes_after, name, count, views = await run_commands(redis_client, [
+        ('AM.NUMCHANGES', 'concurrent_doc'),
+        ('AM.GETTEXT', 'concurrent_doc', 'data.name'),
+        ('AM.GETINT', 'concurrent_doc', 'data.count'),
+        ('AM.GETCOUNTER', 'concurrent_doc', 'data.views'),
+    ])
 
     assert changes_before == changes_after == 4
     assert name == b'Test'
@@ -133,50 +184,61 @@ async def test_concurrent_operations_then_persistence(redis_client, clean_redis)
 
 
 @pytest.mark.concurrent
-async def test_concurrent_map_updates(redis_client, clean_redis):
+async def test_concurrent_map_updates(redis_client, direct_client, clean_redis):
     """Test that concurrent field creation results in correct map size."""
     await redis_client.execute_command('AM.NEW', 'concurrent_map')
 
     # Add 5 fields concurrently
     await asyncio.gather(*[
-        redis_client.execute_command('AM.PUTTEXT', 'concurrent_map', f'field_{i}', f'value_{i}')
+        direct_client.execute_command('AM.PUTTEXT', 'concurrent_map', f'field_{i}', f'value_{i}')
         for i in range(1, 6)
     ])
 
-    # Should have 5 fields
-    maplen = await redis_client.execute_command('AM.MAPLEN', 'concurrent_map', '')
-    assert maplen == 5
-
-
-@pytest.mark.concurrent
-@pytest.mark.slow
-async def test_stress_many_concurrent_increments(redis_client, clean_redis):
-    """Stress test with many concurrent counter increments."""
-    await redis_client.execute_command('AM.NEW', 'stress_counter')
-    await redis_client.execute_command('AM.PUTCOUNTER', 'stress_counter', 'total', 0)
+    maplen, changes = await run_commands(redis_client, [
+        ('AM.MAPLEN', 'concurrent_map', ''),
+        ('AM.NUMCHANGES', 'concurrent_map'),
+    ])
 
-    # Launch 20 concurrent increments
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.INCCOUNTER', 'stress_counter', 'total', 1)
-        for _ in range(20)
+    # Should have 5 fields, one change per writer
+    assert maplen == 5
+    assert changes == 5
+
+
+async def test_mput_map_updates(redis_client, clean_redis):
+    """Test that one AM.MPUT writes several map fields in a single change."""
+    # Add 5 fields with one command
+    fields = []
+    for i in range(1, 6):
+        fields.extend([f'field_{i}', 'text', f'value_{i}'])
+
+    # Create the document, write the fields and read them back in one round-trip
+    _, _, maplen, changes = await run_commands(redis_client, [
+        ('AM.NEW', 'mput_map'),
+        ('AM.MPUT', 'mput_map', *fields),
+        ('AM.MAPLEN', 'mput_map', ''),
+        ('AM.NUMCHANGES', 'mput_map'),
     ])
 
-    value = await redis_client.execute_command('AM.GETCOUNTER', 'stress_counter', 'total')
-    assert value == 20
+    # Should have 5 fields, written as a single change
+    assert maplen == 5
+    assert changes == 1
 
 
 @pytest.mark.concurrent
-async def test_concurrent_list_mixed_types(redis_client, clean_redis):
+async def test_concurrent_list_mixed_types(redis_client, direct_client, clean_redis):
     """Test concurrent appends of different types to a list."""
-    await redis_client.execute_command('AM.NEW', 'mixed_list')
-    await redis_client.execute_command('AM.CREATELIST', 'mixed_list', 'mixed')
+    # Create the document and its list in one round-trip
+    await run_commands(redis_client, [
+        ('AM.NEW', 'mixed_list'),
+        ('AM.CREATELIST', 'mixed_list', 'mixed'),
+    ])
 
     # Append different types concurrently
     await asyncio.gather(
-        redis_client.execute_command('AM.APPENDTEXT', 'mixed_list', 'mixed', 'text_value'),
-        redis_client.execute_command('AM.APPENDINT', 'mixed_list', 'mixed', 123),
-        redis_client.execute_command('AM.APPENDDOUBLE', 'mixed_list', 'mixed', 3.14),
-        redis_client.execute_command('AM.APPENDBOOL', 'mixed_list', 'mixed', 1)
+        direct_client.execute_command('AM.APPENDTEXT', 'mixed_list', 'mixed', 'text_value'),
+        direct_client.execute_command('AM.APPENDINT', 'mixed_list', 'mixed', 123),
+        direct_client.execute_command('AM.APPENDDOUBLE', 'mixed_list', 'mixed', 3.14),
+        direct_client.execute_command('AM.APPENDBOOL', 'mixed_list', 'mixed', 1)
     )
 
     length = await redis_client.execute_command('AM.LISTLEN', 'mixed_list', 'mixed')
@@ -186,37 +248,43 @@ async def test_concurrent_list_mixed_types(redis_client, clean_redis):
 @pytest.mark.concurrent
 async def test_interleaved_multi_field_updates(redis_client, clean_redis):
     """Test interleaved operations on multiple fields."""
-    await redis_client.execute_command('AM.NEW', 'interleaved')
-
-    # Run 3 rounds of concurrent updates to 2 fields
-    for round_num in range(1, 4):
-        await asyncio.gather(
-            redis_client.execute_command('AM.PUTTEXT', 'interleaved', 'field_a', f'round_{round_num}_a'),
-            redis_client.execute_command('AM.PUTTEXT', 'interleaved', 'field_b', f'round_{round_num}_b')
-        )
+    # 3 rounds of updates to 2 fields, interleaved round by round, plus the
+    # verification reads, all in a single pipeline. Commands run in order
+    # on one connection, so round 3 is the last write to each field.
+    results = await run_commands(redis_client, [
+        ('AM.NEW', 'interleaved'),
+        *[
+            ('AM.PUTTEXT', 'interleaved', field, f'round_{round_num}_{suffix}')
+            for round_num in range(1, 4)
+            for field, suffix in (('field_a', 'a'), ('field_b', 'b'))
+        ],
+        ('AM.GETTEXT', 'interleaved', 'field_a'),
+        ('AM.GETTEXT', 'interleaved', 'field_b'),
+        ('AM.NUMCHANGES', 'interleaved'),
+    ])
+    val_a, val_b, changes = results[-3:]
 
     # Final values should be from round 3
-    val_a = await redis_client.execute_command('AM.GETTEXT', 'interleaved', 'field_a')
-    val_b = await redis_client.execute_command('AM.GETTEXT', 'interleaved', 'field_b')
-
     assert val_a == b'round_3_a'
     assert val_b == b'round_3_b'
 
     # Should have 6 changes (3 rounds × 2 fields)
-    changes = await redis_client.execute_command('AM.NUMCHANGES', 'interleaved')
     assert changes == 6
 
 
 @pytest.mark.concurrent
-async def test_concurrent_counter_increment_decrement(redis_client, clean_redis):
+async def test_concurrent_counter_increment_decrement(redis_client, direct_client, clean_redis):
     """Test concurrent increments and decrements on a counter."""
-    await redis_client.execute_command('AM.NEW', 'balance')
-    await redis_client.execute_command('AM.PUTCOUNTER', 'balance', 'amount', 100)
+    # Create the document and its counter in one round-trip
+    await run_commands(redis_client, [
+        ('AM.NEW', 'balance'),
+        ('AM.PUTCOUNTER', 'balance', 'amount', 100),
+    ])
 
     # Concurrent increment and decrement
     await asyncio.gather(
-        redis_client.execute_command('AM.INCCOUNTER', 'balance', 'amount', 50),
-        redis_client.execute_command('AM.INCCOUNTER', 'balance', 'amount', -30)
+        direct_client.execute_command('AM.INCCOUNTER', 'balance', 'amount', 50),
+        direct_client.execute_command('AM.INCCOUNTER', 'balance', 'amount', -30)
     )
 
     # Should be 100 + 50 - 30 = 120
@@ -225,15 +293,15 @@ async def test_concurrent_counter_increment_decrement(redis_client, clean_redis)
 
 
 @pytest.mark.concurrent
-async def test_json_export_after_concurrent_ops(redis_client, clean_redis):
+async def test_json_export_after_concurrent_ops(redis_client, direct_client, clean_redis):
     """Test JSON export consistency after concurrent operations."""
     await redis_client.execute_command('AM.NEW', 'json_test')
 
     # Build complex structure concurrently
     await asyncio.gather(
-        redis_client.execute_command('AM.PUTTEXT', 'json_test', 'user.name', 'Alice'),
-        redis_client.execute_command('AM.PUTINT', 'json_test', 'user.age', 25),
-        redis_client.execute_command('AM.PUTBOOL', 'json_test', 'user.active', 1)
+        direct_client.execute_command('AM.PUTTEXT', 'json_test', 'user.name', 'Alice'),
+        direct_client.execute_command('AM.PUTINT', 'json_test', 'user.age', 25),
+        direct_client.execute_command('AM.PUTBOOL', 'json_test', 'user.active', 1)
     )
 
     # Export to JSON
@@ -244,45 +312,52 @@ async def test_json_export_after_concurrent_ops(redis_client, clean_redis):
     assert b'25' in json_data
 
 
+async def test_json_export_after_mput(redis_client, clean_redis):
+    """Test JSON export of a structure written by one AM.MPUT."""
+    # Create the document, build a complex structure in a single change and
+    # export it to JSON in one round-trip
+    *_, json_data = await run_commands(redis_client, [
+        ('AM.NEW', 'json_mput'),
+        (
+            'AM.MPUT', 'json_mput',
+            'user.name', 'text', 'Alice',
+            'user.age', 'int', 25,
+            'user.active', 'bool', 1,
+        ),
+        ('AM.TOJSON', 'json_mput'),
+    ])
+
+    # JSON should contain all fields (basic validation)
+    assert b'Alice' in json_data
+    assert b'25' in json_data
+
+
 @pytest.mark.concurrent
-async def test_complex_concurrent_scenario(redis_client, clean_redis):
+async def test_complex_concurrent_scenario(redis_client, direct_client, clean_redis):
     """Test complex scenario with mixed concurrent operations."""
-    await redis_client.execute_command('AM.NEW', 'complex_doc')
-
-    # Initialize structures
-    await redis_client.execute_command('AM.PUTCOUNTER', 'complex_doc', 'stats.views', 0)
-    await redis_client.execute_command('AM.CREATELIST', 'complex_doc', 'tags')
+    # Create the document and initialize structures in one round-trip
+    await run_commands(redis_client, [
+        ('AM.NEW', 'complex_doc'),
+        ('AM.PUTCOUNTER', 'complex_doc', 'stats.views', 0),
+        ('AM.CREATELIST', 'complex_doc', 'tags'),
+    ])
 
     # Concurrent operations of different types
     await asyncio.gather(
-        redis_client.execute_command('AM.INCCOUNTER', 'complex_doc', 'stats.views', 1),
-        redis_client.execute_command('AM.APPENDTEXT', 'complex_doc', 'tags', 'tag1'),
-        redis_client.execute_command('AM.PUTTEXT', 'complex_doc', 'metadata.author', 'Alice'),
-        redis_client.execute_command('AM.INCCOUNTER', 'complex_doc', 'stats.views', 1),
-        redis_client.execute_command('AM.APPENDTEXT', 'complex_doc', 'tags', 'tag2')
+        direct_client.execute_command('AM.INCCOUNTER', 'complex_doc', 'stats.views', 1),
+        direct_client.execute_command('AM.APPENDTEXT', 'complex_doc', 'tags', 'tag1'),
+        direct_client.execute_command('AM.PUTTEXT', 'complex_doc', 'metadata.author', 'Alice'),
+        direct_client.execute_command('AM.INCCOUNTER', 'complex_doc', 'stats.views', 1),
+        direct_client.execute_command('AM.APPENDTEXT', 'complex_doc', 'tags', 'tag2')
     )
 
     # Verify results
-    views = await redis_client.execute_command('AM.GETCOUNTER', 'complex_doc', 'stats.views')
-    tags_len = await redis_client.execute_command('AM.LISTLEN', 'complex_doc', 'tags')
-    author = await redis_client.execute_command('AM.GETTEXT', 'complex_doc', 'metadata.author')
+    views, tags_len, author = await run_commands(redis_client, [
+        ('AM.GETCOUNTER', 'complex_doc', 'stats.views'),
+        ('AM.LISTLEN', 'complex_doc', 'tags'),
+        ('AM.GETTEXT', 'complex_doc', 'metadata.author'),
+    ])
 
     assert views == 2
     assert tags_len == 2
     assert author == b'Alice'
-
-
-@pytest.mark.concurrent
-async def test_rapid_sequential_counter_operations(redis_client, clean_redis):
-    """Test rapid sequential counter operations."""
-    await redis_client.execute_command('AM.NEW', 'rapid_counter')
-    await redis_client.execute_command('AM.PUTCOUNTER', 'rapid_counter', 'score', 0)
-
-    # Rapidly increment and decrement (sequential but fast)
-    for _ in range(10):
-        await redis_client.execute_command('AM.INCCOUNTER', 'rapid_counter', 'score', 5)
-        await redis_client.execute_command('AM.INCCOUNTER', 'rapid_counter', 'score', -2)
-
-    # Should be 0 + (5-2)*10 = 30
-    value = await redis_client.execute_command('AM.GETCOUNTER', 'rapid_counter', 'score')
-    assert value == 30
@@ -6,37 +6,53 @@ Tests complex scenarios with multiple documents syncing concurrently.
 import pytest
 import asyncio
 
+from conftest import run_commands
+
+
+async def gossip_round(client, docs):
+    """
+    Bring every document up to date in a single anti-entropy round.
+
+    All change sets are fetched in one pipeline, then each document gets the
+    union of every other document's changes in one AM.APPLY, so a full mesh
+    costs two round-trips instead of a CHANGES/APPLY exchange per pair.
+    """
+    all_changes = await run_commands(client, [('AM.CHANGES', doc) for doc in docs])
+    await run_commands(client, [
+        ('AM.APPLY', doc, *[
+            change
+            for j, changes in enumerate(all_changes) if j != i
+            for change in changes
+        ])
+        for i, doc in enumerate(docs)
+    ])
+
 
 @pytest.mark.sync
 @pytest.mark.concurrent
 async def test_concurrent_sync_to_multiple_targets(redis_client, clean_redis):
     """Test syncing from one source to multiple targets concurrently."""
-    # Create source with data
-    await redis_client.execute_command('AM.NEW', 'source')
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'field', 'value')
-    await redis_client.execute_command('AM.PUTINT', 'source', 'count', 42)
-
-    changes = await redis_client.execute_command('AM.CHANGES', 'source')
+    # Create source with data and fetch its changes in one round-trip
+    *_, changes = await run_commands(redis_client, [
+        ('AM.NEW', 'source'),
+        ('AM.PUTTEXT', 'source', 'field', 'value'),
+        ('AM.PUTINT', 'source', 'count', 42),
+        ('AM.CHANGES', 'source'),
+    ])
 
     # Create 5 target documents
     targets = [f'target_{i}' for i in range(5)]
 
-    # Create all targets concurrently
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.NEW', target)
-        for target in targets
-    ])
-
-    # Apply changes to all targets concurrently
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.APPLY', target, *changes)
+    # Create each target and apply the source's changes to it in one batch
+    await run_commands(redis_client, [
+        command
         for target in targets
+        for command in (('AM.NEW', target), ('AM.APPLY', target, *changes))
     ])
 
     # Verify all targets have the same data
-    results = await asyncio.gather(*[
-        redis_client.execute_command('AM.GETTEXT', target, 'field')
-        for target in targets
+    results = await run_commands(redis_client, [
+        ('AM.GETTEXT', target, 'field') for target in targets
     ])
 
     assert all(r == b'value' for r in results)
@@ -46,55 +62,45 @@ async def test_concurrent_sync_to_multiple_targets(redis_client, clean_redis):
 @pytest.mark.concurrent
 async def test_network_partition_simulation(redis_client, clean_redis):
     """Simulate a network partition where some documents can't sync initially."""
-    # Create three documents
-    await redis_client.execute_command('AM.NEW', 'node_a')
-    await redis_client.execute_command('AM.NEW', 'node_b')
-    await redis_client.execute_command('AM.NEW', 'node_c')
-
-    # A and B can communicate, C is partitioned
-    await redis_client.execute_command('AM.PUTTEXT', 'node_a', 'from_a', 'data_a')
-    await redis_client.execute_command('AM.PUTTEXT', 'node_b', 'from_b', 'data_b')
-    await redis_client.execute_command('AM.PUTTEXT', 'node_c', 'from_c', 'data_c')
-
-    # A and B sync with each other (C is isolated)
-    changes_a = await redis_client.execute_command('AM.CHANGES', 'node_a')
-    changes_b = await redis_client.execute_command('AM.CHANGES', 'node_b')
-
-    await asyncio.gather(
-        redis_client.execute_command('AM.APPLY', 'node_b', *changes_a),
-        redis_client.execute_command('AM.APPLY', 'node_a', *changes_b)
-    )
+    # Create three documents, each with its own data, then let A and B
+    # sync with each other while C is partitioned
+    results = await run_commands(redis_client, [
+        ('AM.NEW', 'node_a'),
+        ('AM.NEW', 'node_b'),
+        ('AM.NEW', 'node_c'),
+        ('AM.PUTTEXT', 'node_a', 'from_a', 'data_a'),
+        ('AM.PUTTEXT', 'node_b', 'from_b', 'data_b'),
+        ('AM.PUTTEXT', 'node_c', 'from_c', 'data_c'),
+        ('AM.COPYCHANGES', 'node_a', 'node_b'),
+        ('AM.COPYCHANGES', 'node_b', 'node_a'),
+        ('AM.GETTEXT', 'node_b', 'from_a'),
+        ('AM.GETTEXT', 'node_b', 'from_c'),
+    ])
+    val_a_on_b, val_c_on_b = results[-2:]
 
     # Verify A and B have each other's data
-    val_a_on_b = await redis_client.execute_command('AM.GETTEXT', 'node_b', 'from_a')
     assert val_a_on_b == b'data_a'
 
     # Verify C's data is not on B yet
-    val_c_on_b = await redis_client.execute_command('AM.GETTEXT', 'node_b', 'from_c')
     assert val_c_on_b is None
 
-    # "Network partition heals" - C rejoins
-    changes_c = await redis_client.execute_command('AM.CHANGES', 'node_c')
-    changes_a_updated = await redis_client.execute_command('AM.CHANGES', 'node_a')
-    changes_b_updated = await redis_client.execute_command('AM.CHANGES', 'node_b')
-
-    # C syncs with A and B
-    await asyncio.gather(
-        redis_client.execute_command('AM.APPLY', 'node_c', *changes_a_updated),
-        redis_client.execute_command('AM.APPLY', 'node_c', *changes_b_updated),
-        redis_client.execute_command('AM.APPLY', 'node_a', *changes_c),
-        redis_client.execute_command('AM.APPLY', 'node_b', *changes_c)
-    )
+    # "Network partition heals" - C rejoins and syncs with A and B in one
+    # pipeline: C first collects A's and B's changes, then sends its own
+    await run_commands(redis_client, [
+        ('AM.COPYCHANGES', 'node_a', 'node_c'),
+        ('AM.COPYCHANGES', 'node_b', 'node_c'),
+        ('AM.COPYCHANGES', 'node_c', 'node_a'),
+        ('AM.COPYCHANGES', 'node_c', 'node_b'),
+    ])
 
     # All nodes should have all data (eventual consistency)
-    for node in ['node_a', 'node_b', 'node_c']:
-        val_a = await redis_client.execute_command('AM.GETTEXT', node, 'from_a')
-        val_b = await redis_client.execute_command('AM.GETTEXT', node, 'from_b')
-        val_c = await redis_client.execute_command('AM.GETTEXT', node, 'from_c')
-
-        assert val_a == b'data_a'
-        assert val_b == b'data_b'
-        assert val_c == b'data_c'
+    nodes = ['node_a', 'node_b', 'node_c']
+    values = await run_commands(redis_client, [
+        ('AM.GETTEXT', node, field)
+        for node in nodes
+        for field in ('from_a', 'from_b', 'from_c')
+    ])
+    assert values == [b'data_a', b'data_b', b'data_c'] * len(nodes)
 
 
 @pytest.mark.sync
@@ -108,35 +114,39 @@ async def test_concurrent_bidirectional_sync_multiple_pairs(redis_client, clean_
         ('doc_c1', 'doc_c2'),
     ]
 
-    # Create all documents
-    for doc1, doc2 in pairs:
-        await redis_client.execute_command('AM.NEW', doc1)
-        await redis_client.execute_command('AM.NEW', doc2)
-
-    # Each pair gets different data
-    for idx, (doc1, doc2) in enumerate(pairs):
-        await redis_client.execute_command('AM.PUTTEXT', doc1, 'field', f'from_{doc1}')
-        await redis_client.execute_command('AM.PUTTEXT', doc2, 'field', f'from_{doc2}')
+    # Create all documents, each pair with different data
+    await run_commands(redis_client, [
+        command
+        for pair in pairs
+        for doc in pair
+        for command in (
+            ('AM.NEW', doc),
+            ('AM.PUTTEXT', doc, 'field', f'from_{doc}'),
+        )
+    ])
 
-    # Sync all pairs concurrently
+    # Sync all pairs concurrently: both directions' changes in one pipeline,
+    # then both applies in a second
     async def sync_pair(doc1, doc2):
-        changes_1 = await redis_client.execute_command('AM.CHANGES', doc1)
-        changes_2 = await redis_client.execute_command('AM.CHANGES', doc2)
+        changes_1, changes_2 = await run_commands(redis_client, [
+            ('AM.CHANGES', doc1),
+            ('AM.CHANGES', doc2),
+        ])
 
-        await asyncio.gather(
-            redis_client.execute_command('AM.APPLY', doc2, *changes_1),
-            redis_client.execute_command('AM.APPLY', doc1, *changes_2)
-        )
+        await run_commands(redis_client, [
+            ('AM.APPLY', doc2, *changes_1),
+            ('AM.APPLY', doc1, *changes_2),
+        ])
 
-    await asyncio.gather(*[
-        sync_pair(doc1, doc2) for doc1, doc2 in pairs
-    ])
+    async with asyncio.TaskGroup() as tg:
+        for doc1, doc2 in pairs:
+            tg.create_task(sync_pair(doc1, doc2))
 
     # Verify each pair converged
-    for doc1, doc2 in pairs:
-        val1 = await redis_client.execute_command('AM.GETTEXT', doc1, 'field')
-        val2 = await redis_client.execute_command('AM.GETTEXT', doc2, 'field')
-
+    values = await run_commands(redis_client, [
+        ('AM.GETTEXT', doc, 'field') for pair in pairs for doc in pair
+    ])
+    for val1, val2 in zip(values[0::2], values[1::2]):
         # Both should have same value (LWW conflict resolution)
         assert val1 == val2
 
@@ -146,40 +156,42 @@ async def test_concurrent_bidirectional_sync_multiple_pairs(redis_client, clean_
 async def test_star_topology_sync(redis_client, clean_redis):
     """Test sync in a star topology: one central hub syncing with multiple spokes."""
     # Create hub and spokes
-    await redis_client.execute_command('AM.NEW', 'hub')
     spokes = [f'spoke_{i}' for i in range(4)]
-
-    for spoke in spokes:
-        await redis_client.execute_command('AM.NEW', spoke)
-        await redis_client.execute_command('AM.PUTTEXT', spoke, f'data_from_{spoke}', 'value')
-
-    # All spokes sync their changes to hub concurrently
-    async def sync_spoke_to_hub(spoke):
-        changes = await redis_client.execute_command('AM.CHANGES', spoke)
-        await redis_client.execute_command('AM.APPLY', 'hub', *changes)
-
-    await asyncio.gather(*[
-        sync_spoke_to_hub(spoke) for spoke in spokes
+    await run_commands(redis_client, [
+        ('AM.NEW', 'hub'),
+        *[
+            command
+            for spoke in spokes
+            for command in (
+                ('AM.NEW', spoke),
+                ('AM.PUTTEXT', spoke, f'data_from_{spoke}', 'value'),
+            )
+        ],
     ])
 
+    # All spokes sync their changes to hub: fetch every spoke's changes in
+    # one batch, then apply them all to the hub in a second batch
+    spoke_changes = await run_commands(redis_client, [('AM.CHANGES', spoke) for spoke in spokes])
+    await run_commands(redis_client, [('AM.APPLY', 'hub', *changes) for changes in spoke_changes])
+
     # Hub should have data from all spokes
-    for spoke in spokes:
-        val = await redis_client.execute_command('AM.GETTEXT', 'hub', f'data_from_{spoke}')
-        assert val == b'value'
+    values = await run_commands(redis_client, [
+        ('AM.GETTEXT', 'hub', f'data_from_{spoke}') for spoke in spokes
+    ])
+    assert values == [b'value'] * len(spokes)
 
     # Now hub syncs back to all spokes concurrently
     hub_changes = await redis_client.execute_command('AM.CHANGES', 'hub')
 
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.APPLY', spoke, *hub_changes)
-        for spoke in spokes
-    ])
+    await run_commands(redis_client, [('AM.APPLY', spoke, *hub_changes) for spoke in spokes])
 
     # All spokes should now have data from all other spokes
-    for spoke in spokes:
-        for other_spoke in spokes:
-            val = await redis_client.execute_command('AM.GETTEXT', spoke, f'data_from_{other_spoke}')
-            assert val == b'value'
+    values = await run_commands(redis_client, [
+        ('AM.GETTEXT', spoke, f'data_from_{other_spoke}')
+        for spoke in spokes
+        for other_spoke in spokes
+    ])
+    assert values == [b'value'] * len(spokes) ** 2
 
 
 @pytest.mark.sync
@@ -190,72 +202,56 @@ async def test_eventual_consistency_stress(redis_client, clean_redis):
     num_docs = 6
     docs = [f'doc_{i}' for i in range(num_docs)]
 
-    # Create all documents
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.NEW', doc)
-        for doc in docs
-    ])
-
-    # Each document gets unique data
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.PUTTEXT', doc, f'field_from_{doc}', f'value_{i}')
+    # Create each document with its own unique data in one batch
+    await run_commands(redis_client, [
+        command
         for i, doc in enumerate(docs)
-    ])
-
-    # Multiple rounds of random pairwise syncing
-    async def sync_documents(doc1, doc2):
-        changes_1 = await redis_client.execute_command('AM.CHANGES', doc1)
-        changes_2 = await redis_client.execute_command('AM.CHANGES', doc2)
-
-        await asyncio.gather(
-            redis_client.execute_command('AM.APPLY', doc2, *changes_1),
-            redis_client.execute_command('AM.APPLY', doc1, *changes_2)
+        for command in (
+            ('AM.NEW', doc),
+            ('AM.PUTTEXT', doc, f'field_from_{doc}', f'value_{i}'),
         )
+    ])
 
-    # Sync all pairs (full mesh)
-    for i in range(num_docs):
-        for j in range(i + 1, num_docs):
-            await sync_documents(docs[i], docs[j])
+    # Sync all documents (full mesh) in one gossip round
+    await gossip_round(redis_client, docs)
 
     # All documents should have all fields (eventual consistency)
-    for doc in docs:
-        for other_doc in docs:
-            field_name = f'field_from_{other_doc}'
-            val = await redis_client.execute_command('AM.GETTEXT', doc, field_name)
-            assert val is not None  # Should have data from all docs
+    values = await run_commands(redis_client, [
+        ('AM.GETTEXT', doc, f'field_from_{other_doc}')
+        for doc in docs
+        for other_doc in docs
+    ])
+    assert None not in values  # Should have data from all docs
 
 
 @pytest.mark.sync
 @pytest.mark.concurrent
-async def test_concurrent_counter_sync(redis_client, clean_redis):
+async def test_concurrent_counter_sync(redis_client, direct_client, clean_redis):
     """Test that concurrent counter increments sync correctly across documents."""
-    # Create two documents with shared counter
-    await redis_client.execute_command('AM.NEW', 'doc1')
-    await redis_client.execute_command('AM.PUTCOUNTER', 'doc1', 'counter', 0)
-
-    # Sync to doc2
-    changes = await redis_client.execute_command('AM.CHANGES', 'doc1')
-    await redis_client.execute_command('AM.NEW', 'doc2')
-    await redis_client.execute_command('AM.APPLY', 'doc2', *changes)
+    # Create two documents with shared counter: doc2 is synced as a fork
+    await run_commands(redis_client, [
+        ('AM.NEW', 'doc1'),
+        ('AM.PUTCOUNTER', 'doc1', 'counter', 0),
+        ('AM.FORK', 'doc1', 'doc2'),
+    ])
 
     # Both increment concurrently while offline
     await asyncio.gather(
-        redis_client.execute_command('AM.INCCOUNTER', 'doc1', 'counter', 10),
-        redis_client.execute_command('AM.INCCOUNTER', 'doc2', 'counter', 15)
+        direct_client.execute_command('AM.INCCOUNTER', 'doc1', 'counter', 10),
+        direct_client.execute_command('AM.INCCOUNTER', 'doc2', 'counter', 15)
     )
 
     # Sync bidirectionally
-    changes_1 = await redis_client.execute_command('AM.CHANGES', 'doc1')
-    changes_2 = await redis_client.execute_command('AM.CHANGES', 'doc2')
-
-    await asyncio.gather(
-        redis_client.execute_command('AM.APPLY', 'doc2', *changes_1),
-        redis_client.execute_command('AM.APPLY', 'doc1', *changes_2)
-    )
+    await run_commands(redis_client, [
+        ('AM.COPYCHANGES', 'doc1', 'doc2'),
+        ('AM.COPYCHANGES', 'doc2', 'doc1'),
+    ])
 
     # Both should converge to sum: 0 + 10 + 15 = 25
-    val1 = await redis_client.execute_command('AM.GETCOUNTER', 'doc1', 'counter')
-    val2 = await redis_client.execute_command('AM.GETCOUNTER', 'doc2', 'counter')
+    val1, val2 = await run_commands(redis_client, [
+        ('AM.GETCOUNTER', 'doc1', 'counter'),
+        ('AM.GETCOUNTER', 'doc2', 'counter'),
+    ])
 
     assert val1 == 25
     assert val2 == 25
@@ -267,40 +263,52 @@ async def test_ring_topology_sync(redis_client, clean_redis):
     """Test sync in a ring topology: each node syncs to its neighbor."""
     nodes = [f'node_{i}' for i in range(5)]
 
-    # Create all nodes
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.NEW', node)
-        for node in nodes
+    # Create all nodes and give each one unique data in one pipeline
+    await run_commands(redis_client, [
+        *[('AM.NEW', node) for node in nodes],
+        *[('AM.PUTTEXT', node, f'data_{i}', f'value_{i}') for i, node in enumerate(nodes)],
     ])
 
-    # Each node gets unique data
-    for i, node in enumerate(nodes):
-        await redis_client.execute_command('AM.PUTTEXT', node, f'data_{i}', f'value_{i}')
-
     # Sync in a ring: node_0 -> node_1 -> node_2 -> ... -> node_0
-    for i in range(len(nodes)):
-        current = nodes[i]
-        next_node = nodes[(i + 1) % len(nodes)]
-
-        changes = await redis_client.execute_command('AM.CHANGES', current)
-        await redis_client.execute_command('AM.APPLY', next_node, *changes)
-
-    # After one round, each node should have data from its predecessor
-    # Continue syncing multiple rounds until all data propagates
-    for round_num in range(len(nodes)):
-        for i in range(len(nodes)):
-            current = nodes[i]
-            next_node = nodes[(i + 1) % len(nodes)]
-
-            changes = await redis_client.execute_command('AM.CHANGES', current)
-            if changes:  # Only apply if there are changes
-                await redis_client.execute_command('AM.APPLY', next_node, *changes)
+    # Each round fetches every node's changes in one pipeline and applies them
+    # to the next node in a second, moving data one hop around the ring.
+    # sent_heads remembers each node's heads as of its last send, so a round
+    # only ships the changes made since then instead of the whole history.
+    sent_heads = [[] for _ in nodes]
+
+    async def ring_round():
+        results = await run_commands(redis_client, [
+            command
+            for i, node in enumerate(nodes)
+            for command in (('AM.CHANGES', node, *sent_heads[i]), ('AM.HEADS', node))
+        ])
+        all_changes = results[0::2]
+        sent_heads[:] = results[1::2]
+        await run_commands(redis_client, [
+            ('AM.APPLY', nodes[(i + 1) % len(nodes)], *changes)
+            for i, changes in enumerate(all_changes)
+            if changes  # Only apply if there are changes
+        ])
+
+    # Keep syncing until all data propagates. Nothing is written during the
+    # sync, so once every node has every head seen at the start of a round
+    # the ring has converged and the remaining rounds can be skipped.
+    for _ in range(len(nodes) + 1):
+        await ring_round()
+        all_heads = {head for heads in sent_heads for head in heads}
+        have_all = await run_commands(redis_client, [
+            ('AM.HAVEHEADS', node, *all_heads) for node in nodes
+        ])
+        if all(have_all):
+            break
 
     # Eventually all nodes should have all data
-    for node in nodes:
-        for i in range(len(nodes)):
-            val = await redis_client.execute_command('AM.GETTEXT', node, f'data_{i}')
-            assert val == f'value_{i}'.encode()
+    values = await run_commands(redis_client, [
+        ('AM.GETTEXT', node, f'data_{i}')
+        for node in nodes
+        for i in range(len(nodes))
+    ])
+    assert values == [f'value_{i}'.encode() for i in range(len(nodes))] * len(nodes)
 
 
 @pytest.mark.sync
@@ -308,41 +316,25 @@ async def test_ring_topology_sync(redis_client, clean_redis):
 async def test_concurrent_sync_with_persistence(redis_client, clean_redis):
     """Test that documents synced concurrently can all be persisted correctly."""
     # Create source
-    await redis_client.execute_command('AM.NEW', 'source')
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'data', 'shared_value')
-
-    changes = await redis_client.execute_command('AM.CHANGES', 'source')
+    await run_commands(redis_client, [
+        ('AM.NEW', 'source'),
+        ('AM.PUTTEXT', 'source', 'data', 'shared_value'),
+    ])
 
     # Create and sync multiple targets concurrently
     targets = [f'target_{i}' for i in range(3)]
 
     await asyncio.gather(*[
-        redis_client.execute_command('AM.NEW', target)
-        for target in targets
-    ])
-
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.APPLY', target, *changes)
+        redis_client.execute_command('AM.FORK', 'source', target)
         for target in targets
     ])
 
-    # Save all targets concurrently
-    saved_data = await asyncio.gather(*[
-        redis_client.execute_command('AM.SAVE', target)
-        for target in targets
-    ])
-
-    # Delete and reload all targets
+    # Round-trip all targets through the save format server-side
     await asyncio.gather(*[
-        redis_client.delete(target)
+        redis_client.execute_command('AM.COMPACT', target)
         for target in targets
     ])
 
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.LOAD', target, data)
-        for target, data in zip(targets, saved_data)
-    ])
-
     # Verify all reloaded correctly
     results = await asyncio.gather(*[
         redis_client.execute_command('AM.GETTEXT', target, 'data')
@@ -356,31 +348,30 @@ async def test_concurrent_sync_with_persistence(redis_client, clean_redis):
 @pytest.mark.concurrent
 async def test_cascading_sync(redis_client, clean_redis):
     """Test cascading sync: A -> B -> C."""
-    # Create three documents
-    await redis_client.execute_command('AM.NEW', 'doc_a')
-    await redis_client.execute_command('AM.NEW', 'doc_b')
-    await redis_client.execute_command('AM.NEW', 'doc_c')
-
-    # A gets original data
-    await redis_client.execute_command('AM.PUTTEXT', 'doc_a', 'field', 'original')
-
-    # A -> B
-    changes_a = await redis_client.execute_command('AM.CHANGES', 'doc_a')
-    await redis_client.execute_command('AM.APPLY', 'doc_b', *changes_a)
+    # Create three documents, give A the original data and cascade it in
+    # one pipeline: commands run in order, so B is synced before C copies it
+    await run_commands(redis_client, [
+        ('AM.NEW', 'doc_a'),
+        ('AM.NEW', 'doc_b'),
+        ('AM.NEW', 'doc_c'),
+        ('AM.PUTTEXT', 'doc_a', 'field', 'original'),
+        # A -> B
+        ('AM.COPYCHANGES', 'doc_a', 'doc_b'),
+        # B -> C
+        ('AM.COPYCHANGES', 'doc_b', 'doc_c'),
+    ])
 
-    # B -> C
-    changes_b = await redis_client.execute_command('AM.CHANGES', 'doc_b')
-    await redis_client.execute_command('AM.APPLY', 'doc_c', *changes_b)
+    val, count_a, count_b, count_c = await run_commands(redis_client, [
+        ('AM.GETTEXT', 'doc_c', 'field'),
+        ('AM.NUMCHANGES', 'doc_a'),
+        ('AM.NUMCHANGES', 'doc_b'),
+        ('AM.NUMCHANGES', 'doc_c'),
+    ])
 
     # C should have the data that originated from A
-    val = await redis_client.execute_command('AM.GETTEXT', 'doc_c', 'field')
     assert val == b'original'
 
     # All three should have same change count
-    count_a = await redis_client.execute_command('AM.NUMCHANGES', 'doc_a')
-    count_b = await redis_client.execute_command('AM.NUMCHANGES', 'doc_b')
-    count_c = await redis_client.execute_command('AM.NUMCHANGES', 'doc_c')
-
     assert count_a == count_b == count_c == 1
 
 
@@ -390,34 +381,20 @@ async def test_sync_convergence_verification(redis_client, clean_redis):
     """Verify that all synced documents have identical state (convergence test)."""
     docs = ['doc1', 'doc2', 'doc3']
 
-    # Create all documents
-    await asyncio.gather(*[
-        redis_client.execute_command('AM.NEW', doc)
-        for doc in docs
+    # Create all documents, each with different data, in one pipeline
+    await run_commands(redis_client, [
+        *[('AM.NEW', doc) for doc in docs],
+        ('AM.PUTTEXT', 'doc1', 'field1', 'value1'),
+        ('AM.PUTTEXT', 'doc2', 'field2', 'value2'),
+        ('AM.PUTTEXT', 'doc3', 'field3', 'value3'),
     ])
 
-    # Each adds different data
-    await redis_client.execute_command('AM.PUTTEXT', 'doc1', 'field1', 'value1')
-    await redis_client.execute_command('AM.PUTTEXT', 'doc2', 'field2', 'value2')
-    await redis_client.execute_command('AM.PUTTEXT', 'doc3', 'field3', 'value3')
-
-    # Full mesh sync
-    async def full_mesh_sync():
-        for i, doc_i in enumerate(docs):
-            for j, doc_j in enumerate(docs):
-                if i != j:
-                    changes = await redis_client.execute_command('AM.CHANGES', doc_i)
-                    await redis_client.execute_command('AM.APPLY', doc_j, *changes)
-
     # Run full mesh sync
-    await full_mesh_sync()
+    await gossip_round(redis_client, docs)
 
-    # All documents should have identical state
-    # Export to JSON and compare
-    json_outputs = await asyncio.gather(*[
-        redis_client.execute_command('AM.TOJSON', doc)
-        for doc in docs
-    ])
+    # All documents should have identical state: compare 32-byte digests of
+    # each document's heads instead of exporting every document to JSON
+    head_hashes = await run_commands(redis_client, [('AM.HEADHASH', doc) for doc in docs])
 
-    # All JSON outputs should be identical (convergence!)
-    assert all(j == json_outputs[0] for j in json_outputs)
+    # All digests should be identical (convergence!)
+    assert len(set(head_hashes)) == 1
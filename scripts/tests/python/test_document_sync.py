@@ -7,30 +7,38 @@ This is the key capability that bash tests couldn't properly exercise.
 import pytest
 import asyncio
 
+from conftest import run_commands
+
+# Pre-encoded document keys reused across tests
+SOURCE = b'source'
+TARGET = b'target'
+DOC_A = b'doc_a'
+DOC_B = b'doc_b'
+
 
 @pytest.mark.sync
 async def test_basic_one_way_sync(redis_client, clean_redis):
     """Test basic one-way synchronization from source to target."""
-    # Create source document with data
-    await redis_client.execute_command('AM.NEW', 'source')
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'name', 'Alice')
-    await redis_client.execute_command('AM.PUTINT', 'source', 'age', 30)
-
-    # Get changes from source
-    changes = await redis_client.execute_command('AM.CHANGES', 'source')
+    # Create source document with data and read back its changes
+    *_, changes = await run_commands(redis_client, [
+        ('AM.NEW', SOURCE),
+        ('AM.PUTTEXT', SOURCE, 'name', 'Alice'),
+        ('AM.PUTINT', SOURCE, 'age', 30),
+        ('AM.CHANGES', SOURCE),
+    ])
 
     # Verify we got a list of binary changes
     assert isinstance(changes, list)
     assert len(changes) == 2
     assert all(isinstance(c, bytes) for c in changes)
 
-    # Create target and apply changes
-    await redis_client.execute_command('AM.NEW', 'target')
-    await redis_client.execute_command('AM.APPLY', 'target', *changes)
-
-    # Verify target has same data
-    name = await redis_client.execute_command('AM.GETTEXT', 'target', 'name')
-    age = await redis_client.execute_command('AM.GETINT', 'target', 'age')
+    # Create target, apply changes and verify target has same data
+    *_, name, age = await run_commands(redis_client, [
+        ('AM.NEW', TARGET),
+        ('AM.APPLY', TARGET, *changes),
+        ('AM.GETTEXT', TARGET, 'name'),
+        ('AM.GETINT', TARGET, 'age'),
+    ])
 
     assert name == b'Alice'
     assert age == 30
@@ -39,100 +47,87 @@ async def test_basic_one_way_sync(redis_client, clean_redis):
 @pytest.mark.sync
 async def test_bidirectional_sync(redis_client, clean_redis):
     """Test bidirectional synchronization between two documents."""
-    # Create two documents
-    await redis_client.execute_command('AM.NEW', 'doc_a')
-    await redis_client.execute_command('AM.NEW', 'doc_b')
-
-    # Each document gets different data
-    await redis_client.execute_command('AM.PUTTEXT', 'doc_a', 'field1', 'from_a')
-    await redis_client.execute_command('AM.PUTTEXT', 'doc_b', 'field2', 'from_b')
-
-    # Get changes from both
-    changes_a = await redis_client.execute_command('AM.CHANGES', 'doc_a')
-    changes_b = await redis_client.execute_command('AM.CHANGES', 'doc_b')
-
-    # Apply A's changes to B
-    await redis_client.execute_command('AM.APPLY', 'doc_b', *changes_a)
-
-    # Apply B's changes to A
-    await redis_client.execute_command('AM.APPLY', 'doc_a', *changes_b)
+    # Create two documents, each with different data
+    *_, changes_a, changes_b = await run_commands(redis_client, [
+        ('AM.NEW', DOC_A),
+        ('AM.NEW', DOC_B),
+        ('AM.PUTTEXT', DOC_A, 'field1', 'from_a'),
+        ('AM.PUTTEXT', DOC_B, 'field2', 'from_b'),
+        ('AM.CHANGES', DOC_A),
+        ('AM.CHANGES', DOC_B),
+    ])
+
+    # Apply each document's changes to the other and read both back
+    *_, values_a, values_b = await run_commands(redis_client, [
+        ('AM.APPLY', DOC_B, *changes_a),
+        ('AM.APPLY', DOC_A, *changes_b),
+        ('AM.MGET', DOC_A, 'field1', 'field2'),
+        ('AM.MGET', DOC_B, 'field1', 'field2'),
+    ])
 
     # Both documents should now have both fields
-    field1_a = await redis_client.execute_command('AM.GETTEXT', 'doc_a', 'field1')
-    field2_a = await redis_client.execute_command('AM.GETTEXT', 'doc_a', 'field2')
-    field1_b = await redis_client.execute_command('AM.GETTEXT', 'doc_b', 'field1')
-    field2_b = await redis_client.execute_command('AM.GETTEXT', 'doc_b', 'field2')
-
-    assert field1_a == b'from_a'
-    assert field2_a == b'from_b'
-    assert field1_b == b'from_a'
-    assert field2_b == b'from_b'
+    assert values_a == values_b == [b'from_a', b'from_b']
 
 
 @pytest.mark.sync
 async def test_multi_document_sync_three_way(redis_client, clean_redis):
     """Test synchronization across three documents."""
-    # Create three documents
-    await redis_client.execute_command('AM.NEW', 'doc1')
-    await redis_client.execute_command('AM.NEW', 'doc2')
-    await redis_client.execute_command('AM.NEW', 'doc3')
+    docs = ['doc1', 'doc2', 'doc3']
 
-    # Each gets unique data
-    await redis_client.execute_command('AM.PUTTEXT', 'doc1', 'from_doc1', 'value1')
-    await redis_client.execute_command('AM.PUTTEXT', 'doc2', 'from_doc2', 'value2')
-    await redis_client.execute_command('AM.PUTTEXT', 'doc3', 'from_doc3', 'value3')
+    # Create three documents, each with unique data
+    results = await run_commands(redis_client, [
+        *[('AM.NEW', doc) for doc in docs],
+        *[('AM.PUTTEXT', doc, f'from_{doc}', f'value{i}') for i, doc in enumerate(docs, 1)],
+        *[('AM.CHANGES', doc) for doc in docs],
+    ])
+    changes_1, changes_2, changes_3 = results[-3:]
 
     # Full mesh sync: each document receives changes from all others
-    changes_1 = await redis_client.execute_command('AM.CHANGES', 'doc1')
-    changes_2 = await redis_client.execute_command('AM.CHANGES', 'doc2')
-    changes_3 = await redis_client.execute_command('AM.CHANGES', 'doc3')
-
-    # Apply all changes to all documents
-    await redis_client.execute_command('AM.APPLY', 'doc1', *changes_2, *changes_3)
-    await redis_client.execute_command('AM.APPLY', 'doc2', *changes_1, *changes_3)
-    await redis_client.execute_command('AM.APPLY', 'doc3', *changes_1, *changes_2)
+    results = await run_commands(redis_client, [
+        ('AM.APPLY', 'doc1', *changes_2, *changes_3),
+        ('AM.APPLY', 'doc2', *changes_1, *changes_3),
+        ('AM.APPLY', 'doc3', *changes_1, *changes_2),
+        *[('AM.MGET', doc, 'from_doc1', 'from_doc2', 'from_doc3') for doc in docs],
+    ])
 
     # All three documents should have all three fields
-    for doc in ['doc1', 'doc2', 'doc3']:
-        val1 = await redis_client.execute_command('AM.GETTEXT', doc, 'from_doc1')
-        val2 = await redis_client.execute_command('AM.GETTEXT', doc, 'from_doc2')
-        val3 = await redis_client.execute_command('AM.GETTEXT', doc, 'from_doc3')
-
-        assert val1 == b'value1'
-        assert val2 == b'value2'
-        assert val3 == b'value3'
+    for values in results[3:]:
+        assert values == [b'value1', b'value2', b'value3']
 
 
 @pytest.mark.sync
 async def test_incremental_sync(redis_client, clean_redis):
     """Test incremental synchronization (syncing only new changes)."""
     # Create documents
-    await redis_client.execute_command('AM.NEW', 'source')
-    await redis_client.execute_command('AM.NEW', 'target')
-
-    # Initial sync
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'field1', 'initial')
-    changes_1 = await redis_client.execute_command('AM.CHANGES', 'source')
-    await redis_client.execute_command('AM.APPLY', 'target', *changes_1)
+    *_, changes_1 = await run_commands(redis_client, [
+        ('AM.NEW', SOURCE),
+        ('AM.NEW', TARGET),
+        ('AM.PUTTEXT', SOURCE, 'field1', 'initial'),
+        ('AM.CHANGES', SOURCE),
+    ])
+
+    # Initial sync, remember what target has, then make more changes to source
+    *_, val, heads, _ = await run_commands(redis_client, [
+        ('AM.APPLY', TARGET, *changes_1),
+        ('AM.GETTEXT', TARGET, 'field1'),
+        ('AM.HEADS', TARGET),
+        ('AM.MPUT', SOURCE, 'field2', 'text', 'update1', 'field3', 'text', 'update2'),
+    ])
 
     # Verify initial sync
-    val = await redis_client.execute_command('AM.GETTEXT', 'target', 'field1')
     assert val == b'initial'
 
-    # Make more changes to source
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'field2', 'update1')
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'field3', 'update2')
-
-    # Get ALL changes (target doesn't know which it has)
-    all_changes = await redis_client.execute_command('AM.CHANGES', 'source')
+    # Copy only the changes made since target's heads
+    copied, val2, val3 = await run_commands(redis_client, [
+        ('AM.COPYCHANGES', SOURCE, TARGET, *heads),
+        ('AM.GETTEXT', TARGET, 'field2'),
+        ('AM.GETTEXT', TARGET, 'field3'),
+    ])
 
-    # Apply all changes (Automerge handles deduplication)
-    await redis_client.execute_command('AM.APPLY', 'target', *all_changes)
+    # The two new fields were written as one change, and only it was sent
+    assert copied == 1
 
     # Verify new fields synced
-    val2 = await redis_client.execute_command('AM.GETTEXT', 'target', 'field2')
-    val3 = await redis_client.execute_command('AM.GETTEXT', 'target', 'field3')
-
     assert val2 == b'update1'
     assert val3 == b'update2'
 
@@ -141,30 +136,31 @@ async def test_incremental_sync(redis_client, clean_redis):
 async def test_sync_with_conflicts(redis_client, clean_redis):
     """Test synchronization when both documents have edited the same field."""
     # Create documents with initial shared state
-    await redis_client.execute_command('AM.NEW', 'doc_a')
-    await redis_client.execute_command('AM.PUTTEXT', 'doc_a', 'shared_field', 'initial')
-
-    # Sync to doc_b
-    changes = await redis_client.execute_command('AM.CHANGES', 'doc_a')
-    await redis_client.execute_command('AM.NEW', 'doc_b')
-    await redis_client.execute_command('AM.APPLY', 'doc_b', *changes)
-
-    # Both documents now have same initial state
-    # Now both edit the same field (conflict!)
-    await redis_client.execute_command('AM.PUTTEXT', 'doc_a', 'shared_field', 'value_from_a')
-    await redis_client.execute_command('AM.PUTTEXT', 'doc_b', 'shared_field', 'value_from_b')
+    *_, changes = await run_commands(redis_client, [
+        ('AM.NEW', DOC_A),
+        ('AM.PUTTEXT', DOC_A, 'shared_field', 'initial'),
+        ('AM.CHANGES', DOC_A),
+    ])
+
+    # Sync to doc_b, then both edit the same field (conflict!)
+    *_, changes_a, changes_b = await run_commands(redis_client, [
+        ('AM.NEW', DOC_B),
+        ('AM.APPLY', DOC_B, *changes),
+        ('AM.PUTTEXT', DOC_A, 'shared_field', 'value_from_a'),
+        ('AM.PUTTEXT', DOC_B, 'shared_field', 'value_from_b'),
+        ('AM.CHANGES', DOC_A),
+        ('AM.CHANGES', DOC_B),
+    ])
 
     # Sync changes bidirectionally
-    changes_a = await redis_client.execute_command('AM.CHANGES', 'doc_a')
-    changes_b = await redis_client.execute_command('AM.CHANGES', 'doc_b')
-
-    await redis_client.execute_command('AM.APPLY', 'doc_b', *changes_a)
-    await redis_client.execute_command('AM.APPLY', 'doc_a', *changes_b)
+    *_, val_a, val_b = await run_commands(redis_client, [
+        ('AM.APPLY', DOC_B, *changes_a),
+        ('AM.APPLY', DOC_A, *changes_b),
+        ('AM.GETTEXT', DOC_A, 'shared_field'),
+        ('AM.GETTEXT', DOC_B, 'shared_field'),
+    ])
 
     # Both documents should converge to the same value (deterministic)
-    val_a = await redis_client.execute_command('AM.GETTEXT', 'doc_a', 'shared_field')
-    val_b = await redis_client.execute_command('AM.GETTEXT', 'doc_b', 'shared_field')
-
     assert val_a == val_b  # Convergence!
 
 
@@ -172,29 +168,31 @@ async def test_sync_with_conflicts(redis_client, clean_redis):
 async def test_sync_counter_operations(redis_client, clean_redis):
     """Test that counter increments sync correctly (CRDT behavior)."""
     # Create documents
-    await redis_client.execute_command('AM.NEW', 'doc_a')
-    await redis_client.execute_command('AM.PUTCOUNTER', 'doc_a', 'counter', 0)
-
-    # Sync initial counter to doc_b
-    changes = await redis_client.execute_command('AM.CHANGES', 'doc_a')
-    await redis_client.execute_command('AM.NEW', 'doc_b')
-    await redis_client.execute_command('AM.APPLY', 'doc_b', *changes)
-
-    # Both increment concurrently (offline)
-    await redis_client.execute_command('AM.INCCOUNTER', 'doc_a', 'counter', 5)
-    await redis_client.execute_command('AM.INCCOUNTER', 'doc_b', 'counter', 3)
+    *_, changes = await run_commands(redis_client, [
+        ('AM.NEW', DOC_A),
+        ('AM.PUTCOUNTER', DOC_A, 'counter', 0),
+        ('AM.CHANGES', DOC_A),
+    ])
+
+    # Sync initial counter to doc_b, then both increment concurrently (offline)
+    *_, changes_a, changes_b = await run_commands(redis_client, [
+        ('AM.NEW', DOC_B),
+        ('AM.APPLY', DOC_B, *changes),
+        ('AM.INCCOUNTER', DOC_A, 'counter', 5),
+        ('AM.INCCOUNTER', DOC_B, 'counter', 3),
+        ('AM.CHANGES', DOC_A),
+        ('AM.CHANGES', DOC_B),
+    ])
 
     # Sync changes
-    changes_a = await redis_client.execute_command('AM.CHANGES', 'doc_a')
-    changes_b = await redis_client.execute_command('AM.CHANGES', 'doc_b')
-
-    await redis_client.execute_command('AM.APPLY', 'doc_b', *changes_a)
-    await redis_client.execute_command('AM.APPLY', 'doc_a', *changes_b)
+    *_, val_a, val_b = await run_commands(redis_client, [
+        ('AM.APPLY', DOC_B, *changes_a),
+        ('AM.APPLY', DOC_A, *changes_b),
+        ('AM.GETCOUNTER', DOC_A, 'counter'),
+        ('AM.GETCOUNTER', DOC_B, 'counter'),
+    ])
 
     # Both should have counter = 0 + 5 + 3 = 8 (sum of increments)
-    val_a = await redis_client.execute_command('AM.GETCOUNTER', 'doc_a', 'counter')
-    val_b = await redis_client.execute_command('AM.GETCOUNTER', 'doc_b', 'counter')
-
     assert val_a == 8
     assert val_b == 8
 
@@ -203,30 +201,32 @@ async def test_sync_counter_operations(redis_client, clean_redis):
 async def test_sync_list_operations(redis_client, clean_redis):
     """Test that list operations sync correctly."""
     # Create document with list
-    await redis_client.execute_command('AM.NEW', 'doc_a')
-    await redis_client.execute_command('AM.CREATELIST', 'doc_a', 'items')
-    await redis_client.execute_command('AM.APPENDTEXT', 'doc_a', 'items', 'item1')
-
-    # Sync to doc_b
-    changes = await redis_client.execute_command('AM.CHANGES', 'doc_a')
-    await redis_client.execute_command('AM.NEW', 'doc_b')
-    await redis_client.execute_command('AM.APPLY', 'doc_b', *changes)
-
-    # Both append to list concurrently
-    await redis_client.execute_command('AM.APPENDTEXT', 'doc_a', 'items', 'from_a')
-    await redis_client.execute_command('AM.APPENDTEXT', 'doc_b', 'items', 'from_b')
+    *_, changes = await run_commands(redis_client, [
+        ('AM.NEW', DOC_A),
+        ('AM.CREATELIST', DOC_A, 'items'),
+        ('AM.APPENDTEXT', DOC_A, 'items', 'item1'),
+        ('AM.CHANGES', DOC_A),
+    ])
+
+    # Sync to doc_b, then both append to list concurrently
+    *_, changes_a, changes_b = await run_commands(redis_client, [
+        ('AM.NEW', DOC_B),
+        ('AM.APPLY', DOC_B, *changes),
+        ('AM.APPENDTEXT', DOC_A, 'items', 'from_a'),
+        ('AM.APPENDTEXT', DOC_B, 'items', 'from_b'),
+        ('AM.CHANGES', DOC_A),
+        ('AM.CHANGES', DOC_B),
+    ])
 
     # Sync
-    changes_a = await redis_client.execute_command('AM.CHANGES', 'doc_a')
-    changes_b = await redis_client.execute_command('AM.CHANGES', 'doc_b')
-
-    await redis_client.execute_command('AM.APPLY', 'doc_b', *changes_a)
-    await redis_client.execute_command('AM.APPLY', 'doc_a', *changes_b)
+    *_, len_a, len_b = await run_commands(redis_client, [
+        ('AM.APPLY', DOC_B, *changes_a),
+        ('AM.APPLY', DOC_A, *changes_b),
+        ('AM.LISTLEN', DOC_A, 'items'),
+        ('AM.LISTLEN', DOC_B, 'items'),
+    ])
 
     # Both should have 3 items
-    len_a = await redis_client.execute_command('AM.LISTLEN', 'doc_a', 'items')
-    len_b = await redis_client.execute_command('AM.LISTLEN', 'doc_b', 'items')
-
     assert len_a == 3
     assert len_b == 3
 
@@ -234,12 +234,13 @@ async def test_sync_list_operations(redis_client, clean_redis):
 @pytest.mark.sync
 async def test_empty_changes_application(redis_client, clean_redis):
     """Test applying empty changes list (idempotence)."""
-    await redis_client.execute_command('AM.NEW', 'doc')
-    await redis_client.execute_command('AM.PUTTEXT', 'doc', 'field', 'value')
-
     # Get changes from a document with no changes
-    await redis_client.execute_command('AM.NEW', 'empty_doc')
-    empty_changes = await redis_client.execute_command('AM.CHANGES', 'empty_doc')
+    *_, empty_changes = await run_commands(redis_client, [
+        ('AM.NEW', 'doc'),
+        ('AM.PUTTEXT', 'doc', 'field', 'value'),
+        ('AM.NEW', 'empty_doc'),
+        ('AM.CHANGES', 'empty_doc'),
+    ])
 
     # empty_changes should be an empty list
     assert isinstance(empty_changes, list)
@@ -258,48 +259,42 @@ async def test_empty_changes_application(redis_client, clean_redis):
 @pytest.mark.sync
 async def test_idempotent_change_application(redis_client, clean_redis):
     """Test that applying the same changes multiple times is idempotent."""
-    # Create source
-    await redis_client.execute_command('AM.NEW', 'source')
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'field', 'value')
-
-    changes = await redis_client.execute_command('AM.CHANGES', 'source')
-
-    # Create target and apply changes
-    await redis_client.execute_command('AM.NEW', 'target')
-    await redis_client.execute_command('AM.APPLY', 'target', *changes)
-
-    # Apply same changes again (should be idempotent)
-    await redis_client.execute_command('AM.APPLY', 'target', *changes)
-
-    # And again
-    await redis_client.execute_command('AM.APPLY', 'target', *changes)
+    # Create source and target, then copy the same changes three times
+    *_, first, second, third, val, num_changes = await run_commands(redis_client, [
+        ('AM.NEW', SOURCE),
+        ('AM.PUTTEXT', SOURCE, 'field', 'value'),
+        ('AM.NEW', TARGET),
+        ('AM.COPYCHANGES', SOURCE, TARGET),
+        ('AM.COPYCHANGES', SOURCE, TARGET),
+        ('AM.COPYCHANGES', SOURCE, TARGET),
+        ('AM.GETTEXT', TARGET, 'field'),
+        ('AM.NUMCHANGES', TARGET),
+    ])
+
+    # Only the first copy adds anything; repeats find nothing new
+    assert (first, second, third) == (1, 0, 0)
 
     # Should still have correct value
-    val = await redis_client.execute_command('AM.GETTEXT', 'target', 'field')
     assert val == b'value'
 
     # Should have correct number of changes (changes don't duplicate)
-    num_changes = await redis_client.execute_command('AM.NUMCHANGES', 'target')
     assert num_changes == 1
 
 
 @pytest.mark.sync
 async def test_sync_preserves_change_history(redis_client, clean_redis):
     """Test that synced documents have the same change history."""
-    # Create source with multiple changes
-    await redis_client.execute_command('AM.NEW', 'source')
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'field1', 'value1')
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'field2', 'value2')
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'field3', 'value3')
-
-    source_changes_count = await redis_client.execute_command('AM.NUMCHANGES', 'source')
-
-    # Sync to target
-    changes = await redis_client.execute_command('AM.CHANGES', 'source')
-    await redis_client.execute_command('AM.NEW', 'target')
-    await redis_client.execute_command('AM.APPLY', 'target', *changes)
-
-    target_changes_count = await redis_client.execute_command('AM.NUMCHANGES', 'target')
+    # Create source with multiple changes and sync it to target
+    *_, source_changes_count, _, _, target_changes_count = await run_commands(redis_client, [
+        ('AM.NEW', SOURCE),
+        ('AM.PUTTEXT', SOURCE, 'field1', 'value1'),
+        ('AM.PUTTEXT', SOURCE, 'field2', 'value2'),
+        ('AM.PUTTEXT', SOURCE, 'field3', 'value3'),
+        ('AM.NUMCHANGES', SOURCE),
+        ('AM.NEW', TARGET),
+        ('AM.COPYCHANGES', SOURCE, TARGET),
+        ('AM.NUMCHANGES', TARGET),
+    ])
 
     # Both should have same change count
     assert source_changes_count == target_changes_count == 3
@@ -309,26 +304,19 @@ async def test_sync_preserves_change_history(redis_client, clean_redis):
 @pytest.mark.persistence
 async def test_sync_then_persistence(redis_client, clean_redis):
     """Test that synced documents persist correctly."""
-    # Create and sync documents
-    await redis_client.execute_command('AM.NEW', 'source')
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'data', 'test_value')
-
-    changes = await redis_client.execute_command('AM.CHANGES', 'source')
-
-    await redis_client.execute_command('AM.NEW', 'target')
-    await redis_client.execute_command('AM.APPLY', 'target', *changes)
+    # Create source document, sync it to target, round-trip target through
+    # the save format server-side and verify data and change history survived
+    *_, val, changes_count = await run_commands(redis_client, [
+        ('AM.NEW', SOURCE),
+        ('AM.PUTTEXT', SOURCE, 'data', 'test_value'),
+        ('AM.NEW', TARGET),
+        ('AM.COPYCHANGES', SOURCE, TARGET),
+        ('AM.COMPACT', TARGET),
+        ('AM.GETTEXT', TARGET, 'data'),
+        ('AM.NUMCHANGES', TARGET),
+    ])
 
-    # Save and reload target
-    saved_data = await redis_client.execute_command('AM.SAVE', 'target')
-    await redis_client.delete('target')
-    await redis_client.execute_command('AM.LOAD', 'target', saved_data)
-
-    # Verify data still there
-    val = await redis_client.execute_command('AM.GETTEXT', 'target', 'data')
     assert val == b'test_value'
-
-    # Verify change history preserved
-    changes_count = await redis_client.execute_command('AM.NUMCHANGES', 'target')
     assert changes_count == 1
 
 
@@ -336,27 +324,26 @@ async def test_sync_then_persistence(redis_client, clean_redis):
 async def test_complex_nested_structure_sync(redis_client, clean_redis):
     """Test synchronization of complex nested structures."""
     # Create complex structure on source
-    await redis_client.execute_command('AM.NEW', 'source')
-    await redis_client.execute_command('AM.PUTTEXT', 'source', 'user.name', 'Alice')
-    await redis_client.execute_command('AM.PUTINT', 'source', 'user.age', 30)
-    await redis_client.execute_command('AM.CREATELIST', 'source', 'user.tags')
-    await redis_client.execute_command('AM.APPENDTEXT', 'source', 'user.tags', 'developer')
-    await redis_client.execute_command('AM.APPENDTEXT', 'source', 'user.tags', 'rust')
-    await redis_client.execute_command('AM.PUTCOUNTER', 'source', 'user.views', 0)
-    await redis_client.execute_command('AM.INCCOUNTER', 'source', 'user.views', 100)
-
-    # Sync to target
-    changes = await redis_client.execute_command('AM.CHANGES', 'source')
-    await redis_client.execute_command('AM.NEW', 'target')
-    await redis_client.execute_command('AM.APPLY', 'target', *changes)
-
-    # Verify entire structure synced
-    name = await redis_client.execute_command('AM.GETTEXT', 'target', 'user.name')
-    age = await redis_client.execute_command('AM.GETINT', 'target', 'user.age')
-    tags_len = await redis_client.execute_command('AM.LISTLEN', 'target', 'user.tags')
-    views = await redis_client.execute_command('AM.GETCOUNTER', 'target', 'user.views')
-
-    assert name == b'Alice'
-    assert age == 30
-    assert tags_len == 2
-    assert views == 100
+    *_, blob = await run_commands(redis_client, [
+        ('AM.NEW', SOURCE),
+        ('AM.PUTTEXT', SOURCE, 'user.name', 'Alice'),
+        ('AM.PUTINT', SOURCE, 'user.age', 30),
+        ('AM.CREATELIST', SOURCE, 'user.tags'),
+        ('AM.APPENDTEXT', SOURCE, 'user.tags', 'developer'),
+        ('AM.APPENDTEXT', SOURCE, 'user.tags', 'rust'),
+        ('AM.PUTCOUNTER', SOURCE, 'user.views', 0),
+        ('AM.INCCOUNTER', SOURCE, 'user.views', 100),
+        # The whole history as one blob instead of one reply per change
+        ('AM.SAVESINCE', SOURCE),
+    ])
+
+    # Sync to target and verify entire structure synced
+    *_, added, values, tags_len = await run_commands(redis_client, [
+        ('AM.NEW', TARGET),
+        ('AM.LOADINCREMENTAL', TARGET, blob),
+        ('AM.MGET', TARGET, 'user.name', 'user.age', 'user.views'),
+        ('AM.LISTLEN', TARGET, 'user.tags'),
+    ])
+
+    assert added == 7
+    assert [*values, tags_len] == [b'Alice', 30, 100, 2]
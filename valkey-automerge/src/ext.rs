@@ -43,6 +43,7 @@ use automerge::{
 };
 use chrono::{DateTime, Utc};
 use serde_json::Value as JsonValue;
+use sha2::{Digest, Sha256};
 
 /// Represents a diff operation parsed from unified diff format
 #[derive(Debug, PartialEq)]
@@ -158,14 +159,12 @@ fn parse_path(path: &str) -> Result<Vec<PathSegment>, AutomergeError> {
         match ch {
             '.' if !in_bracket => {
                 if !current.is_empty() {
-                    segments.push(PathSegment::Key(current.clone()));
-                    current.clear();
+                    segments.push(PathSegment::Key(std::mem::take(&mut current)));
                 }
             }
             '[' if !in_bracket => {
                 if !current.is_empty() {
-                    segments.push(PathSegment::Key(current.clone()));
-                    current.clear();
+                    segments.push(PathSegment::Key(std::mem::take(&mut current)));
                 }
                 in_bracket = true;
                 bracket_content.clear();
@@ -1472,6 +1471,74 @@ impl RedisAutomergeClient {
         Ok(None)
     }
 
+    /// Insert several typed values in a single transaction and return the raw change bytes.
+    ///
+    /// All puts are committed as one Automerge change, so a batch of N writes costs one
+    /// change in the history instead of N. Intermediate maps are created as needed, and
+    /// earlier puts in the batch are visible to later ones. Only scalar values are
+    /// supported; if any put fails the whole batch is rolled back.
+    ///
+    /// # Examples
+    ///
+    /// ```rust,no_run
+    /// use redis_automerge::ext::{RedisAutomergeClient, TypedValue};
+    ///
+    /// let mut client = RedisAutomergeClient::new();
+    /// client.put_many_with_change(&[
+    ///     ("user.name", TypedValue::Text("Alice".to_string())),
+    ///     ("user.age", TypedValue::Int(30)),
+    /// ]).unwrap();
+    /// ```
+    pub fn put_many_with_change(
+        &mut self,
+        values: &[(&str, TypedValue)],
+    ) -> Result<Option<Vec<u8>>, AutomergeError> {
+        let mut tx = self.doc.transaction();
+        // Parent of the previous put. A scalar put only touches a child of
+        // its parent, so the resolved ObjId stays valid for sibling fields.
+        let mut last_parent: Option<(Vec<PathSegment>, ObjId)> = None;
+
+        for (path, value) in values {
+            let mut segments = parse_path(path)?;
+            if segments.is_empty() {
+                return Err(AutomergeError::Fail);
+            }
+
+            let scalar = match value {
+                TypedValue::Text(s) => ScalarValue::Str(s.as_str().into()),
+                TypedValue::Int(i) => ScalarValue::Int(*i),
+                TypedValue::Double(f) => ScalarValue::F64(*f),
+                TypedValue::Bool(b) => ScalarValue::Boolean(*b),
+                TypedValue::Timestamp(ts) => ScalarValue::Timestamp(*ts),
+                TypedValue::Counter(c) => ScalarValue::Counter((*c).into()),
+                TypedValue::Null => ScalarValue::Null,
+                TypedValue::Array(_) | TypedValue::Object(_) => {
+                    return Err(AutomergeError::Fail);
+                }
+            };
+
+            let field_name = segments.pop().ok_or(AutomergeError::Fail)?;
+            let parent_obj = match last_parent.take() {
+                Some((parent_path, obj)) if parent_path == segments => obj,
+                _ => navigate_or_create_path(&mut tx, &segments)?,
+            };
+            put_value_to_parent(&mut tx, &parent_obj, &field_name, scalar)?;
+            last_parent = Some((segments, parent_obj));
+        }
+
+        let (hash, _patch) = tx.commit();
+
+        if let Some(h) = hash {
+            if let Some(change) = self.doc.get_change_by_hash(&h) {
+                let change_bytes = change.raw_bytes().to_vec();
+                self.aof.push(change_bytes.clone());
+                return Ok(Some(change_bytes));
+            }
+        }
+
+        Ok(None)
+    }
+
     /// Retrieve a timestamp value using a path (e.g., "event.created_at", "timestamps[0]", or "$.event.timestamp").
     /// Returns the timestamp as an i64 (milliseconds since Unix epoch).
     pub fn get_timestamp(&self, path: &str) -> Result<Option<i64>, AutomergeError> {
@@ -2113,6 +2180,180 @@ impl RedisAutomergeClient {
         self.doc.get_changes(have_deps)
     }
 
+    /// Rewrite the document through the binary save format in place.
+    ///
+    /// This is the server-side equivalent of `AM.SAVE` followed by `AM.LOAD`: the
+    /// document is saved to its compressed representation and loaded back, keeping the
+    /// same actor ID. Content and change history are unchanged.
+    ///
+    /// # Examples
+    ///
+    /// ```rust,no_run
+    /// use redis_automerge::ext::RedisAutomergeClient;
+    ///
+    /// let mut client = RedisAutomergeClient::new();
+    /// client.put_text("field", "value").unwrap();
+    /// client.compact().unwrap();
+    /// assert_eq!(client.get_text("field").unwrap(), Some("value".to_string()));
+    /// ```
+    pub fn compact(&mut self) -> Result<(), AutomergeError> {
+        let actor = self.doc.get_actor().clone();
+        let mut doc = Automerge::load(&self.doc.save())?;
+        doc.set_actor(actor);
+        self.doc = doc;
+        Ok(())
+    }
+
+    /// Create an independent copy of the document with a new actor ID.
+    ///
+    /// The fork shares the full change history of this document, so it can later be
+    /// kept in sync with [`get_changes`](Self::get_changes) and `apply`, but its own
+    /// edits are attributed to a different actor.
+    ///
+    /// # Examples
+    ///
+    /// ```rust,no_run
+    /// use redis_automerge::ext::RedisAutomergeClient;
+    ///
+    /// let mut client = RedisAutomergeClient::new();
+    /// client.put_text("field", "value").unwrap();
+    ///
+    /// let fork = client.fork();
+    /// assert_eq!(fork.get_text("field").unwrap(), Some("value".to_string()));
+    /// ```
+    pub fn fork(&self) -> Self {
+        Self {
+            doc: self.doc.fork(),
+            aof: Vec::new(),
+        }
+    }
+
+    /// Get the current heads of the document.
+    ///
+    /// The heads are the hashes of the changes that no other change depends on, and
+    /// together identify the current document state. Passing them back to
+    /// [`get_changes`](Self::get_changes) later returns only the changes made since.
+    ///
+    /// # Examples
+    ///
+    /// ```rust,no_run
+    /// use redis_automerge::ext::RedisAutomergeClient;
+    ///
+    /// let mut client = RedisAutomergeClient::new();
+    /// client.put_text("field", "value").unwrap();
+    ///
+    /// let heads = client.get_heads();
+    /// client.put_text("other", "value").unwrap();
+    /// assert_eq!(client.get_changes(&heads).len(), 1);
+    /// ```
+    pub fn get_heads(&self) -> Vec<ChangeHash> {
+        self.doc.get_heads()
+    }
+
+    /// Check whether the document contains every change in `heads`.
+    ///
+    /// Returns `true` when each hash names a change already applied to this document,
+    /// meaning the document has seen at least the state those heads describe. An empty
+    /// list is trivially contained.
+    ///
+    /// # Examples
+    ///
+    /// ```rust,no_run
+    /// use redis_automerge::ext::RedisAutomergeClient;
+    ///
+    /// let mut client = RedisAutomergeClient::new();
+    /// client.put_text("field", "value").unwrap();
+    ///
+    /// let heads = client.get_heads();
+    /// assert!(client.has_heads(&heads));
+    /// assert!(!RedisAutomergeClient::new().has_heads(&heads));
+    /// ```
+    pub fn has_heads(&self, heads: &[ChangeHash]) -> bool {
+        heads
+            .iter()
+            .all(|hash| self.doc.get_change_by_hash(hash).is_some())
+    }
+
+    /// Get a SHA-256 digest of the document's sorted heads.
+    ///
+    /// Two documents with the same change history have the same heads and therefore
+    /// the same digest, so replicas can check convergence by comparing 32 bytes
+    /// instead of exporting and comparing whole documents.
+    ///
+    /// # Examples
+    ///
+    /// ```rust,no_run
+    /// use redis_automerge::ext::{RedisAutomergeClient, RedisAutomergeExt};
+    ///
+    /// let mut client = RedisAutomergeClient::new();
+    /// client.put_text("field", "value").unwrap();
+    ///
+    /// let copy = RedisAutomergeClient::load(&client.save()).unwrap();
+    /// assert_eq!(client.heads_hash(), copy.heads_hash());
+    /// ```
+    pub fn heads_hash(&self) -> [u8; 32] {
+        let mut heads = self.doc.get_heads();
+        heads.sort();
+
+        let mut hasher = Sha256::new();
+        for head in &heads {
+            hasher.update(head.0);
+        }
+        hasher.finalize().into()
+    }
+
+    /// Encode every change not in `heads` as a single blob.
+    ///
+    /// The result is Automerge's incremental save format: the missing changes
+    /// concatenated into one byte string, ready for [`Self::load_incremental`].
+    /// With no heads the blob holds the whole history.
+    ///
+    /// # Examples
+    ///
+    /// ```rust,no_run
+    /// use redis_automerge::ext::RedisAutomergeClient;
+    ///
+    /// let mut client = RedisAutomergeClient::new();
+    /// client.put_text("field1", "value1").unwrap();
+    /// let heads = client.get_heads();
+    /// client.put_text("field2", "value2").unwrap();
+    ///
+    /// // Only the field2 change
+    /// let blob = client.save_since(&heads);
+    /// ```
+    pub fn save_since(&self, heads: &[ChangeHash]) -> Vec<u8> {
+        self.doc.save_after(heads)
+    }
+
+    /// Apply a blob produced by [`Self::save_since`] and return the changes it added.
+    ///
+    /// Changes the document already has are skipped, so loading the same blob twice
+    /// is a no-op. The new changes are buffered for the AOF like those of
+    /// [`RedisAutomergeExt::apply`].
+    ///
+    /// # Examples
+    ///
+    /// ```rust,no_run
+    /// use redis_automerge::ext::RedisAutomergeClient;
+    ///
+    /// let mut source = RedisAutomergeClient::new();
+    /// source.put_text("field", "value").unwrap();
+    ///
+    /// let mut target = RedisAutomergeClient::new();
+    /// let added = target.load_incremental(&source.save_since(&[])).unwrap();
+    /// assert_eq!(added.len(), 1);
+    /// ```
+    pub fn load_incremental(&mut self, data: &[u8]) -> Result<Vec<Change>, AutomergeError> {
+        let before = self.doc.get_heads();
+        self.doc.load_incremental(data)?;
+
+        let added = self.doc.get_changes(&before);
+        for change in &added {
+            self.aof.push(change.raw_bytes().to_vec());
+        }
+        Ok(added)
+    }
+
     /// Get the diff between two document states.
     ///
     /// This uses Automerge's `diff` function to compare two document states identified by
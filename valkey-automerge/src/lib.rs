@@ -13,8 +13,16 @@
 //! - `AM.NEW <key>` - Create a new empty Automerge document
 //! - `AM.LOAD <key> <bytes>` - Load a document from binary format
 //! - `AM.SAVE <key>` - Save a document to binary format
+//! - `AM.COMPACT <key>` - Save and reload a document in place, without leaving the server
+//! - `AM.FORK <src> <dst>` - Copy a document to a new key with its own actor ID
 //! - `AM.APPLY <key> <change>...` - Apply Automerge changes to a document
 //! - `AM.CHANGES <key> [<hash>...]` - Get changes not in the provided hash list (empty = all changes)
+//! - `AM.COPYCHANGES <src> <dst> [<hash>...]` - Apply a document's changes to another document server-side
+//! - `AM.HEADS <key>` - Get the current heads (change hashes) of a document
+//! - `AM.HEADHASH <key>` - Get a SHA-256 digest of the document's heads
+//! - `AM.HAVEHEADS <key> [<hash>...]` - Check whether a document contains all the given changes
+//! - `AM.SAVESINCE <key> [<hash>...]` - Get the changes not in the provided hash list as one blob
+//! - `AM.LOADINCREMENTAL <key> <bytes>` - Apply a blob from `AM.SAVESINCE` to a document
 //! - `AM.NUMCHANGES <key> [<hash>...]` - Get count of changes not in the provided hash list (empty = all changes)
 //! - `AM.GETDIFF <key> BEFORE <hash>... AFTER <hash>...` - Get diff between two document states
 //! - `AM.TOJSON <key> [pretty]` - Export document to JSON format
@@ -32,6 +40,8 @@
 //! - `AM.GETDOUBLE <key> <path>` - Get a double value
 //! - `AM.PUTBOOL <key> <path> <value>` - Set a boolean value
 //! - `AM.GETBOOL <key> <path>` - Get a boolean value
+//! - `AM.MPUT <key> <path> <type> <value> [<path> <type> <value>...]` - Set several typed values in one change
+//! - `AM.MGET <key> <path> [<path>...]` - Get several values in one call
 //!
 //! ## List Operations
 //! - `AM.CREATELIST <key> <path>` - Create a new list
@@ -82,7 +92,7 @@ pub mod index;
 use std::os::raw::{c_char, c_int, c_void};
 
 use automerge::{Change, ChangeHash};
-use ext::{RedisAutomergeClient, RedisAutomergeExt};
+use ext::{RedisAutomergeClient, RedisAutomergeExt, TypedValue};
 use index::IndexConfig;
 #[cfg(not(test))]
 use valkey_module::valkey_module;
@@ -171,6 +181,31 @@ fn publish_change(
     Ok(ValkeyValue::SimpleStringStatic("OK"))
 }
 
+/// Publish a batch of changes to the key's `changes:` channel.
+///
+/// The channel name is built once for the whole batch and each change is
+/// encoded straight from the borrowed bytes, so large syncs do not copy
+/// every change blob just to publish it.
+fn publish_changes<B: AsRef<[u8]>>(
+    ctx: &Context,
+    key_name: &ValkeyString,
+    changes: &[B],
+) -> ValkeyResult {
+    if changes.is_empty() {
+        return Ok(ValkeyValue::SimpleStringStatic("OK"));
+    }
+    let channel_name = format!("changes:{}", key_name.try_as_str()?);
+    use base64::{engine::general_purpose, Engine as _};
+    let ctx_ptr = std::ptr::NonNull::new(ctx.ctx);
+    let channel_str = valkey_module::ValkeyString::create(ctx_ptr, channel_name.as_bytes());
+    for change in changes {
+        let encoded_change = general_purpose::STANDARD.encode(change.as_ref());
+        let change_str = valkey_module::ValkeyString::create(ctx_ptr, encoded_change.as_bytes());
+        ctx.call("PUBLISH", &[&channel_str, &change_str])?;
+    }
+    Ok(ValkeyValue::SimpleStringStatic("OK"))
+}
+
 fn am_load(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
     let mut args = args.into_iter().skip(1);
     let key_name = args.next_arg()?;
@@ -206,6 +241,63 @@ fn am_new(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
     Ok(ValkeyValue::SimpleStringStatic("OK"))
 }
 
+fn am_fork(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
+    if args.len() != 3 {
+        return Err(ValkeyError::WrongArity);
+    }
+    let src_name = &args[1];
+    let dst_name = &args[2];
+
+    let fork = {
+        let key = ctx.open_key(src_name);
+        let client = key
+            .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+            .ok_or(ValkeyError::Str("no such key"))?;
+        client.fork()
+    }; // key is dropped here
+
+    // Set value and close key before calling replicate
+    {
+        let key = ctx.open_key_writable(dst_name);
+        key.set_value(&VALKEY_AUTOMERGE_TYPE, fork)?;
+    } // key is dropped here
+
+    ctx.replicate("am.fork", &[src_name, dst_name]);
+    ctx.notify_keyspace_event(valkey_module::NotifyEvent::MODULE, "am.fork", dst_name);
+
+    // Update search index
+    {
+        let key = ctx.open_key(dst_name);
+        if let Ok(Some(client)) = key.get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE) {
+            try_update_search_index(ctx, &dst_name.to_string(), client);
+        }
+    }
+
+    Ok(ValkeyValue::SimpleStringStatic("OK"))
+}
+
+fn am_compact(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
+    if args.len() != 2 {
+        return Err(ValkeyError::WrongArity);
+    }
+    let key_name = &args[1];
+
+    // Rewrite document and close key before calling replicate
+    {
+        let key = ctx.open_key_writable(key_name);
+        let client = key
+            .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+            .ok_or(ValkeyError::Str("no such key"))?;
+        client
+            .compact()
+            .map_err(|e| ValkeyError::String(e.to_string()))?;
+    } // key is dropped here
+
+    ctx.replicate("am.compact", &[key_name]);
+    ctx.notify_keyspace_event(valkey_module::NotifyEvent::MODULE, "am.compact", key_name);
+    Ok(ValkeyValue::SimpleStringStatic("OK"))
+}
+
 fn am_save(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
     let mut args = args.into_iter().skip(1);
     let key_name = args.next_arg()?;
@@ -916,6 +1008,120 @@ fn am_gettimestamp(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
     }
 }
 
+/// Helper function to parse a typed value for AM.MPUT (`text`, `int`, `double`, `bool`,
+/// `counter` or `timestamp`).
+fn parse_typed_value(
+    value_type: &ValkeyString,
+    value: &ValkeyString,
+) -> Result<TypedValue, ValkeyError> {
+    let value_type = parse_utf8_field(value_type, "type")?.to_lowercase();
+    match value_type.as_str() {
+        "text" => Ok(TypedValue::Text(parse_utf8_value(value)?.to_string())),
+        "int" => value
+            .parse_integer()
+            .map(TypedValue::Int)
+            .map_err(|_| ValkeyError::Str("value must be an integer")),
+        "double" => parse_utf8_value(value)?
+            .parse()
+            .map(TypedValue::Double)
+            .map_err(|_| ValkeyError::Str("value must be a valid double")),
+        "bool" => match parse_utf8_value(value)?.to_lowercase().as_str() {
+            "true" | "1" => Ok(TypedValue::Bool(true)),
+            "false" | "0" => Ok(TypedValue::Bool(false)),
+            _ => Err(ValkeyError::Str("value must be true/false or 1/0")),
+        },
+        "counter" => value
+            .parse_integer()
+            .map(TypedValue::Counter)
+            .map_err(|_| ValkeyError::Str("value must be an integer")),
+        "timestamp" => value
+            .parse_integer()
+            .map(TypedValue::Timestamp)
+            .map_err(|_| {
+                ValkeyError::Str("value must be an integer (Unix timestamp in milliseconds)")
+            }),
+        _ => Err(ValkeyError::Str(
+            "type must be one of text, int, double, bool, counter, timestamp",
+        )),
+    }
+}
+
+fn am_mput(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
+    if args.len() < 5 || (args.len() - 2) % 3 != 0 {
+        return Err(ValkeyError::WrongArity);
+    }
+    let key_name = &args[1];
+    let mut values = Vec::with_capacity((args.len() - 2) / 3);
+    for triple in args[2..].chunks(3) {
+        let field = parse_utf8_field(&triple[0], "field")?;
+        values.push((field, parse_typed_value(&triple[1], &triple[2])?));
+    }
+
+    // Capture change bytes before calling ctx.call
+    let change_bytes = {
+        let key = ctx.open_key_writable(key_name);
+        let client = key
+            .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+            .ok_or(ValkeyError::Str("no such key"))?;
+        client
+            .put_many_with_change(&values)
+            .map_err(|e| ValkeyError::String(e.to_string()))?
+    }; // key is dropped here
+
+    // Publish change to subscribers if one was generated
+    publish_change(ctx, key_name, change_bytes)?;
+
+    let refs: Vec<&ValkeyString> = args[1..].iter().collect();
+    ctx.replicate("am.mput", &refs[..]);
+    ctx.notify_keyspace_event(valkey_module::NotifyEvent::MODULE, "am.mput", key_name);
+
+    // Update search index
+    {
+        let key = ctx.open_key(key_name);
+        if let Ok(Some(client)) = key.get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE) {
+            try_update_search_index(ctx, &key_name.to_string(), client);
+        }
+    }
+
+    Ok(ValkeyValue::SimpleStringStatic("OK"))
+}
+
+fn typed_value_reply(value: TypedValue) -> ValkeyValue {
+    match value {
+        TypedValue::Text(text) => ValkeyValue::BulkString(text),
+        TypedValue::Int(i) | TypedValue::Counter(i) | TypedValue::Timestamp(i) => {
+            ValkeyValue::Integer(i)
+        }
+        TypedValue::Double(f) => ValkeyValue::Float(f),
+        TypedValue::Bool(b) => ValkeyValue::Integer(if b { 1 } else { 0 }),
+        TypedValue::Null => ValkeyValue::Null,
+        nested @ (TypedValue::Array(_) | TypedValue::Object(_)) => {
+            ValkeyValue::BulkString(nested.to_json().to_string())
+        }
+    }
+}
+
+fn am_mget(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
+    if args.len() < 3 {
+        return Err(ValkeyError::WrongArity);
+    }
+    let key_name = &args[1];
+    let key = ctx.open_key(key_name);
+    let client = key
+        .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+        .ok_or(ValkeyError::Str("no such key"))?;
+
+    let mut result = Vec::with_capacity(args.len() - 2);
+    for path_arg in &args[2..] {
+        let path = parse_utf8_field(path_arg, "path")?;
+        let value = client
+            .get_typed_value(path)
+            .map_err(|e| ValkeyError::String(e.to_string()))?;
+        result.push(value.map_or(ValkeyValue::Null, typed_value_reply));
+    }
+    Ok(ValkeyValue::Array(result))
+}
+
 fn am_createlist(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
     if args.len() != 3 {
         return Err(ValkeyError::WrongArity);
@@ -1175,7 +1381,7 @@ fn am_apply(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
         let client = key
             .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
             .ok_or(ValkeyError::Str("no such key"))?;
-        let mut changes = Vec::new();
+        let mut changes = Vec::with_capacity(args.len() - 2);
         for change_str in &args[2..] {
             let bytes = change_str.to_vec();
             let change = Change::from_bytes(bytes)
@@ -1188,10 +1394,8 @@ fn am_apply(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
     } // key is dropped here
 
     // Publish each change to subscribers
-    for change_str in &args[2..] {
-        let change_bytes = change_str.to_vec();
-        publish_change(ctx, key_name, Some(change_bytes))?;
-    }
+    let change_slices: Vec<&[u8]> = args[2..].iter().map(|c| c.as_slice()).collect();
+    publish_changes(ctx, key_name, &change_slices)?;
 
     let refs: Vec<&ValkeyString> = args[1..].iter().collect();
     ctx.replicate("am.apply", &refs[..]);
@@ -1213,13 +1417,13 @@ fn am_changes(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
         return Err(ValkeyError::WrongArity);
     }
     let key_name = &args[1];
-    let key = ctx.open_key_writable(key_name);
+    let key = ctx.open_key(key_name);
     let client = key
         .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
         .ok_or(ValkeyError::Str("no such key"))?;
 
     // Parse have_deps from remaining arguments
-    let mut have_deps = Vec::new();
+    let mut have_deps = Vec::with_capacity(args.len() - 2);
     for hash_arg in &args[2..] {
         let bytes = hash_arg.as_slice();
         let hash = ChangeHash::try_from(bytes)
@@ -1230,27 +1434,207 @@ fn am_changes(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
     // Get changes
     let changes = client.get_changes(&have_deps);
 
-    // Build array response
+    // Build array response, sized up front so large histories do not regrow it
+    let result = changes
+        .iter()
+        .map(|change| ValkeyValue::StringBuffer(change.raw_bytes().to_vec()))
+        .collect();
+
+    Ok(ValkeyValue::Array(result))
+}
+
+fn am_copychanges(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
+    if args.len() < 3 {
+        return Err(ValkeyError::WrongArity);
+    }
+    let src_name = &args[1];
+    let dst_name = &args[2];
+
+    // Parse have_deps from remaining arguments
+    let mut have_deps = Vec::new();
+    for hash_arg in &args[3..] {
+        let bytes = hash_arg.as_slice();
+        let hash = ChangeHash::try_from(bytes)
+            .map_err(|e| ValkeyError::String(format!("invalid change hash: {:?}", e)))?;
+        have_deps.push(hash);
+    }
+
+    // Collect changes from the source without sending them to the client
+    let changes = {
+        let key = ctx.open_key(src_name);
+        let client = key
+            .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+            .ok_or(ValkeyError::Str("no such key"))?;
+        client.get_changes(&have_deps)
+    }; // key is dropped here
+
+    // Only changes the destination did not already have count as copied
+    let change_bytes: Vec<Vec<u8>> = {
+        let key = ctx.open_key_writable(dst_name);
+        let client = key
+            .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+            .ok_or(ValkeyError::Str("no such key"))?;
+        let before = client.get_heads();
+        client
+            .apply(changes)
+            .map_err(|e| ValkeyError::String(e.to_string()))?;
+        client
+            .get_changes(&before)
+            .iter()
+            .map(|c| c.raw_bytes().to_vec())
+            .collect()
+    }; // key is dropped here
+
+    // Publish each added change to subscribers of the destination
+    publish_changes(ctx, dst_name, &change_bytes)?;
+
+    let refs: Vec<&ValkeyString> = args[1..].iter().collect();
+    ctx.replicate("am.copychanges", &refs[..]);
+    ctx.notify_keyspace_event(
+        valkey_module::NotifyEvent::MODULE,
+        "am.copychanges",
+        dst_name,
+    );
+
+    // Update search index
+    {
+        let key = ctx.open_key(dst_name);
+        if let Ok(Some(client)) = key.get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE) {
+            try_update_search_index(ctx, &dst_name.to_string(), client);
+        }
+    }
+
+    Ok(ValkeyValue::Integer(change_bytes.len() as i64))
+}
+
+fn am_heads(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
+    if args.len() != 2 {
+        return Err(ValkeyError::WrongArity);
+    }
+    let key_name = &args[1];
+    let key = ctx.open_key(key_name);
+    let client = key
+        .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+        .ok_or(ValkeyError::Str("no such key"))?;
+
+    // Build array response of raw 32-byte hashes
     let mut result = Vec::new();
-    for change in changes {
-        result.push(ValkeyValue::StringBuffer(change.raw_bytes().to_vec()));
+    for hash in client.get_heads() {
+        result.push(ValkeyValue::StringBuffer(hash.0.to_vec()));
     }
 
     Ok(ValkeyValue::Array(result))
 }
 
+fn am_haveheads(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
+    if args.len() < 2 {
+        return Err(ValkeyError::WrongArity);
+    }
+    let key_name = &args[1];
+    let key = ctx.open_key(key_name);
+    let client = key
+        .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+        .ok_or(ValkeyError::Str("no such key"))?;
+
+    // Parse heads from remaining arguments
+    let mut heads = Vec::new();
+    for hash_arg in &args[2..] {
+        let bytes = hash_arg.as_slice();
+        let hash = ChangeHash::try_from(bytes)
+            .map_err(|e| ValkeyError::String(format!("invalid change hash: {:?}", e)))?;
+        heads.push(hash);
+    }
+
+    Ok(ValkeyValue::Integer(client.has_heads(&heads) as i64))
+}
+
+fn am_savesince(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
+    if args.len() < 2 {
+        return Err(ValkeyError::WrongArity);
+    }
+    let key_name = &args[1];
+    let key = ctx.open_key(key_name);
+    let client = key
+        .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+        .ok_or(ValkeyError::Str("no such key"))?;
+
+    // Parse heads from remaining arguments
+    let mut heads = Vec::with_capacity(args.len() - 2);
+    for hash_arg in &args[2..] {
+        let bytes = hash_arg.as_slice();
+        let hash = ChangeHash::try_from(bytes)
+            .map_err(|e| ValkeyError::String(format!("invalid change hash: {:?}", e)))?;
+        heads.push(hash);
+    }
+
+    Ok(ValkeyValue::StringBuffer(client.save_since(&heads)))
+}
+
+fn am_loadincremental(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
+    if args.len() != 3 {
+        return Err(ValkeyError::WrongArity);
+    }
+    let key_name = &args[1];
+
+    // Load the blob and keep the changes it added for publishing
+    let added = {
+        let key = ctx.open_key_writable(key_name);
+        let client = key
+            .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+            .ok_or(ValkeyError::Str("no such key"))?;
+        client
+            .load_incremental(args[2].as_slice())
+            .map_err(|e| ValkeyError::String(e.to_string()))?
+    }; // key is dropped here
+
+    // Publish each new change to subscribers
+    let change_slices: Vec<&[u8]> = added.iter().map(|c| c.raw_bytes()).collect();
+    publish_changes(ctx, key_name, &change_slices)?;
+
+    let refs: Vec<&ValkeyString> = args[1..].iter().collect();
+    ctx.replicate("am.loadincremental", &refs[..]);
+    ctx.notify_keyspace_event(
+        valkey_module::NotifyEvent::MODULE,
+        "am.loadincremental",
+        key_name,
+    );
+
+    // Update search index
+    {
+        let key = ctx.open_key(key_name);
+        if let Ok(Some(client)) = key.get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE) {
+            try_update_search_index(ctx, &key_name.to_string(), client);
+        }
+    }
+
+    Ok(ValkeyValue::Integer(added.len() as i64))
+}
+
+fn am_headhash(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
+    if args.len() != 2 {
+        return Err(ValkeyError::WrongArity);
+    }
+    let key_name = &args[1];
+    let key = ctx.open_key(key_name);
+    let client = key
+        .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
+        .ok_or(ValkeyError::Str("no such key"))?;
+
+    Ok(ValkeyValue::StringBuffer(client.heads_hash().to_vec()))
+}
+
 fn am_numchanges(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
     if args.len() < 2 {
         return Err(ValkeyError::WrongArity);
     }
     let key_name = &args[1];
-    let key = ctx.open_key_writable(key_name);
+    let key = ctx.open_key(key_name);
     let client = key
         .get_value::<RedisAutomergeClient>(&VALKEY_AUTOMERGE_TYPE)?
         .ok_or(ValkeyError::Str("no such key"))?;
 
     // Parse have_deps from remaining arguments
-    let mut have_deps = Vec::new();
+    let mut have_deps = Vec::with_capacity(args.len() - 2);
     for hash_arg in &args[2..] {
         let bytes = hash_arg.as_slice();
         let hash = ChangeHash::try_from(bytes)
@@ -1630,8 +2014,16 @@ valkey_module! {
         ["am.new", am_new, "write deny-oom", 1, 1, 1],
         ["am.load", am_load, "write", 1, 1, 1],
         ["am.save", am_save, "readonly", 1, 1, 1],
+        ["am.compact", am_compact, "write", 1, 1, 1],
+        ["am.fork", am_fork, "write deny-oom", 1, 2, 1],
         ["am.apply", am_apply, "write deny-oom", 1, 1, 1],
         ["am.changes", am_changes, "readonly", 1, 1, 1],
+        ["am.copychanges", am_copychanges, "write deny-oom", 1, 2, 1],
+        ["am.heads", am_heads, "readonly", 1, 1, 1],
+        ["am.headhash", am_headhash, "readonly", 1, 1, 1],
+        ["am.haveheads", am_haveheads, "readonly", 1, 1, 1],
+        ["am.savesince", am_savesince, "readonly", 1, 1, 1],
+        ["am.loadincremental", am_loadincremental, "write deny-oom", 1, 1, 1],
         ["am.numchanges", am_numchanges, "readonly", 1, 1, 1],
         ["am.getdiff", am_getdiff, "readonly", 1, 1, 1],
         ["am.tojson", am_tojson, "readonly", 1, 1, 1],
@@ -1655,6 +2047,8 @@ valkey_module! {
         ["am.inccounter", am_inccounter, "write deny-oom", 1, 1, 1],
         ["am.puttimestamp", am_puttimestamp, "write deny-oom", 1, 1, 1],
         ["am.gettimestamp", am_gettimestamp, "readonly", 1, 1, 1],
+        ["am.mput", am_mput, "write deny-oom", 1, 1, 1],
+        ["am.mget", am_mget, "readonly", 1, 1, 1],
         ["am.createlist", am_createlist, "write deny-oom", 1, 1, 1],
         ["am.appendtext", am_appendtext, "write deny-oom", 1, 1, 1],
         ["am.appendint", am_appendint, "write deny-oom", 1, 1, 1],
@@ -2871,4 +3265,203 @@ mod tests {
         );
         assert_eq!(loaded.get_bool("active").unwrap(), Some(true));
     }
+
+    #[test]
+    fn put_many_creates_single_change() {
+        let mut client = RedisAutomergeClient::new();
+
+        let change = client
+            .put_many_with_change(&[
+                ("user.name", TypedValue::Text("Alice".to_string())),
+                ("user.age", TypedValue::Int(30)),
+                ("user.score", TypedValue::Double(95.5)),
+                ("user.active", TypedValue::Bool(true)),
+                ("stats.views", TypedValue::Counter(10)),
+                ("joined_at", TypedValue::Timestamp(1704067200000)),
+            ])
+            .unwrap();
+        assert!(change.is_some());
+
+        assert_eq!(client.get_changes(&[]).len(), 1);
+        assert_eq!(
+            client.get_text("user.name").unwrap(),
+            Some("Alice".to_string())
+        );
+        assert_eq!(client.get_int("user.age").unwrap(), Some(30));
+        assert_eq!(client.get_double("user.score").unwrap(), Some(95.5));
+        assert_eq!(client.get_bool("user.active").unwrap(), Some(true));
+        assert_eq!(client.get_counter("stats.views").unwrap(), Some(10));
+        assert_eq!(
+            client.get_timestamp("joined_at").unwrap(),
+            Some(1704067200000)
+        );
+    }
+
+    #[test]
+    fn put_many_rolls_back_on_error() {
+        let mut client = RedisAutomergeClient::new();
+        client.put_text("name", "Alice").unwrap();
+
+        // "name.first" cannot be created because "name" is not a map
+        let result = client.put_many_with_change(&[
+            ("age", TypedValue::Int(30)),
+            ("name.first", TypedValue::Text("Bob".to_string())),
+        ]);
+        assert!(result.is_err());
+
+        assert_eq!(client.get_int("age").unwrap(), None);
+        assert_eq!(client.get_changes(&[]).len(), 1);
+    }
+
+    #[test]
+    fn put_many_sibling_fields_share_parent() {
+        let mut client = RedisAutomergeClient::new();
+        client
+            .put_many_with_change(&[
+                ("user.name", TypedValue::Text("Alice".to_string())),
+                ("user.age", TypedValue::Int(30)),
+                ("user.profile.city", TypedValue::Text("Paris".to_string())),
+                ("user.active", TypedValue::Bool(true)),
+            ])
+            .unwrap();
+
+        assert_eq!(
+            client.get_text("user.name").unwrap(),
+            Some("Alice".to_string())
+        );
+        assert_eq!(client.get_int("user.age").unwrap(), Some(30));
+        assert_eq!(
+            client.get_text("user.profile.city").unwrap(),
+            Some("Paris".to_string())
+        );
+        assert_eq!(client.get_bool("user.active").unwrap(), Some(true));
+        assert_eq!(client.get_map_keys("user").unwrap().unwrap().len(), 4);
+
+        // Overwriting the parent with a scalar must not leave a stale parent
+        let result = client.put_many_with_change(&[
+            ("user.name", TypedValue::Text("Bob".to_string())),
+            ("user", TypedValue::Text("gone".to_string())),
+            ("user.age", TypedValue::Int(31)),
+        ]);
+        assert!(result.is_err());
+        assert_eq!(
+            client.get_text("user.name").unwrap(),
+            Some("Alice".to_string())
+        );
+    }
+
+    #[test]
+    fn heads_track_new_changes() {
+        let mut client = RedisAutomergeClient::new();
+        assert!(client.get_heads().is_empty());
+
+        client.put_text("field1", "value1").unwrap();
+        let heads = client.get_heads();
+        assert_eq!(heads.len(), 1);
+        assert!(client.get_changes(&heads).is_empty());
+
+        client.put_text("field2", "value2").unwrap();
+        client.put_text("field3", "value3").unwrap();
+        let new_changes = client.get_changes(&heads);
+        assert_eq!(new_changes.len(), 2);
+        assert_eq!(client.get_heads(), vec![new_changes[1].hash()]);
+    }
+
+    #[test]
+    fn fork_copies_history_with_new_actor() {
+        let mut client = RedisAutomergeClient::new();
+        client.put_text("name", "Alice").unwrap();
+
+        let mut fork = client.fork();
+        assert_eq!(fork.get_text("name").unwrap(), Some("Alice".to_string()));
+        assert_eq!(fork.get_heads(), client.get_heads());
+
+        // Concurrent edits on both sides merge without actor conflicts
+        client.put_text("a", "from_client").unwrap();
+        fork.put_text("b", "from_fork").unwrap();
+        fork.apply(client.get_changes(&[])).unwrap();
+        client.apply(fork.get_changes(&[])).unwrap();
+
+        assert_eq!(client.get_text("b").unwrap(), Some("from_fork".to_string()));
+        assert_eq!(fork.get_text("a").unwrap(), Some("from_client".to_string()));
+        assert_eq!(fork.get_changes(&[]).len(), 3);
+        assert_eq!(client.get_changes(&[]).len(), 3);
+    }
+
+    #[test]
+    fn heads_hash_matches_after_sync() {
+        let mut doc1 = RedisAutomergeClient::new();
+        let mut doc2 = RedisAutomergeClient::new();
+        doc1.put_text("field1", "value1").unwrap();
+        doc2.put_text("field2", "value2").unwrap();
+        assert_ne!(doc1.heads_hash(), doc2.heads_hash());
+
+        doc1.apply(doc2.get_changes(&[])).unwrap();
+        doc2.apply(doc1.get_changes(&[])).unwrap();
+        assert_eq!(doc1.heads_hash(), doc2.heads_hash());
+    }
+
+    #[test]
+    fn has_heads_after_sync() {
+        let mut doc1 = RedisAutomergeClient::new();
+        let mut doc2 = RedisAutomergeClient::new();
+        doc1.put_text("field1", "value1").unwrap();
+        doc2.put_text("field2", "value2").unwrap();
+
+        let heads1 = doc1.get_heads();
+        assert!(doc1.has_heads(&heads1));
+        assert!(!doc2.has_heads(&heads1));
+        assert!(doc2.has_heads(&[]));
+
+        doc2.apply(doc1.get_changes(&[])).unwrap();
+        assert!(doc2.has_heads(&heads1));
+        assert!(!doc1.has_heads(&doc2.get_heads()));
+    }
+
+    #[test]
+    fn save_since_round_trips_through_load_incremental() {
+        let mut source = RedisAutomergeClient::new();
+        source.put_text("field1", "value1").unwrap();
+        source.put_int("field2", 2).unwrap();
+
+        let mut target = RedisAutomergeClient::new();
+        let added = target.load_incremental(&source.save_since(&[])).unwrap();
+        assert_eq!(added.len(), 2);
+        assert_eq!(
+            target.get_text("field1").unwrap(),
+            Some("value1".to_string())
+        );
+        assert_eq!(target.commands().len(), 2);
+
+        // Only the change made after the target's heads is encoded
+        source.put_text("field3", "value3").unwrap();
+        let blob = source.save_since(&target.get_heads());
+        assert_eq!(target.load_incremental(&blob).unwrap().len(), 1);
+        assert_eq!(
+            target.get_text("field3").unwrap(),
+            Some("value3".to_string())
+        );
+        assert_eq!(target.heads_hash(), source.heads_hash());
+
+        // Loading the same blob again adds nothing
+        assert!(target.load_incremental(&blob).unwrap().is_empty());
+    }
+
+    #[test]
+    fn compact_preserves_content_history_and_actor() {
+        let mut client = RedisAutomergeClient::new();
+        client.put_text("name", "Alice").unwrap();
+        client.put_int("age", 30).unwrap();
+        let heads = client.get_heads();
+
+        client.compact().unwrap();
+
+        assert_eq!(client.get_text("name").unwrap(), Some("Alice".to_string()));
+        assert_eq!(client.get_int("age").unwrap(), Some(30));
+        assert_eq!(client.get_heads(), heads);
+
+        // Writes after compaction continue the same actor's sequence
+        client.put_int("age", 31).unwrap();
+        assert_eq!(client.get_changes(&[]).len(), 3);
+    }
 }